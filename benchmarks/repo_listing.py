@@ -0,0 +1,220 @@
+"""
+Benchmark of repository listing for the GitHub Classroom add-on
+Compares collecting every repository object of a listing before
+filtering (as the add-on used to) with parsing each page into compact
+RepoRecords as it arrives, on synthetic listings shaped like GitHub's.
+Measures parse time and peak memory (tracemalloc); no network is used.
+
+Usage:
+    python benchmarks/repo_listing.py [--repos 5000] [--runs 5]
+"""
+
+import os
+import sys
+import json
+import time
+import types
+import argparse
+import importlib
+import tracemalloc
+
+ADDON_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'github_classroom_addon'
+)
+
+ORG = 'classroom-org'
+STUDENT = 'student42'
+
+
+def load_client_module():
+    """Import github_client without the add-on's __init__ (which needs
+    Blender)"""
+    package = types.ModuleType('github_classroom_addon')
+    package.__path__ = [ADDON_DIR]
+    sys.modules['github_classroom_addon'] = package
+    return importlib.import_module('github_classroom_addon.github_client')
+
+
+def make_repo(index: int, owner: str, name: str):
+    """A repository object with the fields of a GitHub REST listing"""
+    full_name = f"{owner}/{name}"
+    api = f"https://api.github.com/repos/{full_name}"
+    repo = {
+        'id': 100000 + index,
+        'node_id': f"R_kgDOH{index:08d}",
+        'name': name,
+        'full_name': full_name,
+        'private': True,
+        'owner': {
+            'login': owner,
+            'id': 5000,
+            'node_id': "O_kgDOBx1234",
+            'avatar_url': "https://avatars.githubusercontent.com/u/5000?v=4",
+            'gravatar_id': "",
+            'url': f"https://api.github.com/users/{owner}",
+            'html_url': f"https://github.com/{owner}",
+            'followers_url': f"https://api.github.com/users/{owner}/followers",
+            'following_url': f"https://api.github.com/users/{owner}/following{{/other_user}}",
+            'gists_url': f"https://api.github.com/users/{owner}/gists{{/gist_id}}",
+            'starred_url': f"https://api.github.com/users/{owner}/starred{{/owner}}{{/repo}}",
+            'subscriptions_url': f"https://api.github.com/users/{owner}/subscriptions",
+            'organizations_url': f"https://api.github.com/users/{owner}/orgs",
+            'repos_url': f"https://api.github.com/users/{owner}/repos",
+            'events_url': f"https://api.github.com/users/{owner}/events{{/privacy}}",
+            'received_events_url': f"https://api.github.com/users/{owner}/received_events",
+            'type': "Organization",
+            'user_view_type': "public",
+            'site_admin': False,
+        },
+        'html_url': f"https://github.com/{full_name}",
+        'description': f"Assignment repository {index} created by GitHub Classroom",
+        'fork': False,
+        'url': api,
+        'created_at': "2025-09-01T12:00:00Z",
+        'updated_at': "2026-01-%02dT%02d:%02d:00Z" % (28 - index % 28, index % 24, index % 60),
+        'pushed_at': "2026-01-%02dT%02d:%02d:00Z" % (28 - index % 28, index % 24, index % 60),
+        'git_url': f"git://github.com/{full_name}.git",
+        'ssh_url': f"git@github.com:{full_name}.git",
+        'clone_url': f"https://github.com/{full_name}.git",
+        'svn_url': f"https://github.com/{full_name}",
+        'homepage': None,
+        'size': 20480 + index,
+        'stargazers_count': 0,
+        'watchers_count': 0,
+        'language': None,
+        'has_issues': True,
+        'has_projects': True,
+        'has_downloads': True,
+        'has_wiki': True,
+        'has_pages': False,
+        'has_discussions': False,
+        'forks_count': 0,
+        'mirror_url': None,
+        'archived': False,
+        'disabled': False,
+        'open_issues_count': 0,
+        'license': None,
+        'allow_forking': False,
+        'is_template': False,
+        'web_commit_signoff_required': False,
+        'topics': [],
+        'visibility': "private",
+        'forks': 0,
+        'open_issues': 0,
+        'watchers': 0,
+        'default_branch': "main",
+        'permissions': {'admin': True, 'maintain': True, 'push': True,
+                        'triage': True, 'pull': True},
+    }
+    # The many *_url templates of a repository object
+    for kind in ('forks', 'keys', 'collaborators', 'teams', 'hooks',
+                 'issue_events', 'events', 'assignees', 'branches', 'tags',
+                 'blobs', 'git_tags', 'git_refs', 'trees', 'statuses',
+                 'languages', 'stargazers', 'contributors', 'subscribers',
+                 'subscription', 'commits', 'git_commits', 'comments',
+                 'issue_comment', 'contents', 'compare', 'merges',
+                 'archive', 'downloads', 'issues', 'pulls', 'milestones',
+                 'notifications', 'labels', 'releases', 'deployments'):
+        repo[f'{kind}_url'] = f"{api}/{kind}{{/id}}"
+    return repo
+
+
+def make_pages(count: int, student: bool):
+    """Encode a listing of count repositories as 100-repo JSON pages.
+    A student's listing holds a few of their own assignment repos among
+    repositories of other organizations."""
+    repos = []
+    for index in range(count):
+        if student and index % 250 == 0:
+            owner, name = ORG, f"hw{index // 250}-{STUDENT}"
+        elif student:
+            owner, name = f"other-org-{index % 40}", f"project-{index}"
+        else:
+            owner, name = ORG, f"hw{index % 12}-student{index}"
+        repos.append(make_repo(index, owner, name))
+    return [json.dumps(repos[start:start + 100]).encode('utf-8')
+            for start in range(0, count, 100)]
+
+
+def fake_request(pages):
+    """Stand-in for GitHubClassroomClient._request_with_links that
+    decodes pre-encoded pages like a real response"""
+    def request(endpoint, *args):
+        page = int(endpoint.rsplit('page=', 1)[1].split('&')[0])
+        if page > len(pages):
+            return [], None
+        return json.loads(pages[page - 1].decode('utf-8')), None
+    return request
+
+
+def list_full_objects(client, endpoint, keep):
+    """The previous approach: collect every page, then filter"""
+    all_repos = client._paginate(endpoint)
+    return [repo for repo in all_repos if keep(repo)]
+
+
+def list_records(client, endpoint, keep):
+    """Parse each page into RepoRecords and filter it as it arrives"""
+    return [record.to_dict()
+            for record in client._iter_repos(endpoint, keep=keep)]
+
+
+def measure(function, runs):
+    """Run function runs times; Returns: (best seconds, peak bytes)"""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    result = function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repos', type=int, default=5000)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    github_client = load_client_module()
+    # Only the listing methods are used, so no config files are touched
+    client = github_client.GitHubClassroomClient.__new__(
+        github_client.GitHubClassroomClient
+    )
+
+    cases = (
+        ("teacher (all kept)", False,
+         lambda repo: True, lambda record: True),
+        ("student (own repos kept)", True,
+         lambda repo: (repo['owner']['login'] == ORG
+                       and STUDENT in repo['name']),
+         lambda record: record.owner == ORG and STUDENT in record.name),
+    )
+    print(f"{args.repos} repositories, best of {args.runs} runs")
+    for label, student, keep_full, keep_record in cases:
+        client._request_with_links = fake_request(
+            make_pages(args.repos, student)
+        )
+        endpoint = '/orgs/x/repos?sort=updated'
+        old_time, old_peak = measure(
+            lambda: list_full_objects(client, endpoint, keep_full), args.runs
+        )
+        new_time, new_peak = measure(
+            lambda: list_records(client, endpoint, keep_record), args.runs
+        )
+        kept = len(list_records(client, endpoint, keep_record))
+        print(f"{label}: {kept} kept")
+        print(f"  full objects: {old_time * 1000:7.1f} ms, "
+              f"peak {old_peak / 1e6:6.1f} MB")
+        print(f"  records:      {new_time * 1000:7.1f} ms, "
+              f"peak {new_peak / 1e6:6.1f} MB")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,159 @@
+"""
+Benchmark of upload memory use for the GitHub Classroom add-on
+Compares pushing a file by base64-encoding it whole into the JSON
+request (as the add-on used to) with the streaming Base64JSONBody the
+add-on sends now. The request goes to a local sink server in a separate
+process, so only the client's memory is measured (peak, tracemalloc).
+
+Usage:
+    python benchmarks/upload_memory.py [--sizes 10 45 90]
+    python benchmarks/upload_memory.py --sink
+        Run as the sink server: print the port, then accept PUTs.
+"""
+
+import os
+import sys
+import json
+import types
+import base64
+import argparse
+import tempfile
+import importlib
+import subprocess
+import tracemalloc
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+ADDON_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'github_classroom_addon'
+)
+
+# Bytes of the test file written per step
+WRITE_CHUNK_SIZE = 1024 * 1024
+
+
+def load_client_module():
+    """Import github_client without the add-on's __init__ (which needs
+    Blender)"""
+    package = types.ModuleType('github_classroom_addon')
+    package.__path__ = [ADDON_DIR]
+    sys.modules['github_classroom_addon'] = package
+    return importlib.import_module('github_classroom_addon.github_client')
+
+
+# --- Sink server (separate process) ---
+
+class SinkHandler(BaseHTTPRequestHandler):
+    """Reads and discards request bodies, answering like the contents
+    API"""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_PUT(self):
+        remaining = int(self.headers.get('Content-Length', 0))
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, 1 << 20)))
+        body = json.dumps({'content': {'sha': None}}).encode('utf-8')
+        self.send_response(201)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def run_sink():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SinkHandler)
+    print(server.server_port, flush=True)
+    server.serve_forever()
+
+
+# --- Client side ---
+
+def make_file(folder: str, size_mb: int) -> str:
+    """Write a file of random bytes; Returns: its path"""
+    path = os.path.join(folder, f"scene_{size_mb}mb.blend")
+    with open(path, 'wb') as f:
+        for _ in range(size_mb):
+            f.write(os.urandom(WRITE_CHUNK_SIZE))
+    return path
+
+
+def upload_whole(client, path):
+    """The previous approach: encode the whole file into the request"""
+    with open(path, 'rb') as f:
+        content = base64.b64encode(f.read()).decode('ascii')
+    client._make_request(
+        '/repos/classroom-org/hw1-student/contents/scene.blend',
+        method='PUT', data={'message': "Benchmark", 'content': content}
+    )
+
+
+def upload_streaming(client, path):
+    """The add-on's contents API upload"""
+    client._upload('classroom-org', 'hw1-student', 'scene.blend', path,
+                   "Benchmark", None)
+
+
+def peak_memory(function) -> int:
+    """Run function; Returns: peak traced bytes"""
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 45, 90],
+                        help="File sizes in MB")
+    parser.add_argument('--sink', action='store_true',
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.sink:
+        run_sink()
+        return
+
+    sink = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), '--sink'],
+        stdout=subprocess.PIPE, text=True
+    )
+    try:
+        port = int(sink.stdout.readline())
+        github_client = load_client_module()
+        github_client.GITHUB_API_URL = f"http://127.0.0.1:{port}"
+        # Always use the contents API, whatever the file size
+        github_client.LARGE_UPLOAD_THRESHOLD = float('inf')
+
+        with tempfile.TemporaryDirectory() as folder:
+            class BenchmarkClient(github_client.GitHubClassroomClient):
+                """Client keeping its config files in the temporary
+                folder"""
+                def _get_config_dir(self):
+                    return folder
+
+            client = BenchmarkClient()
+            client.token = 'benchmark'
+            client.username = 'student'
+            try:
+                print(f"{'file':>8}  {'whole file':>12}  {'streaming':>12}")
+                for size_mb in args.sizes:
+                    path = make_file(folder, size_mb)
+                    whole = peak_memory(lambda: upload_whole(client, path))
+                    streaming = peak_memory(
+                        lambda: upload_streaming(client, path)
+                    )
+                    os.remove(path)
+                    print(f"{size_mb:>5} MB  {whole / 1e6:>9.1f} MB  "
+                          f"{streaming / 1e6:>9.1f} MB")
+            finally:
+                client.metadata_store.close()
+    finally:
+        sink.kill()
+        sink.wait()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -26,6 +26,8 @@ if addon_dir not in sys.path:
 from . import properties
 from . import operators
 from . import ui
+from . import tasks
+from .github_client import shutdown_github_client
 
 classes = (
     # Property groups (must be registered before they are referenced)
@@ -36,13 +38,19 @@ classes = (
     operators.GITHUB_OT_Logout,
     operators.GITHUB_OT_RefreshRepos,
     operators.GITHUB_OT_OpenFile,
+    operators.GITHUB_OT_DownloadAllSubmissions,
+    operators.GITHUB_OT_AnalyzeSubmissions,
     operators.GITHUB_OT_PushFile,
+    operators.GITHUB_OT_SubmitFile,
     operators.GITHUB_OT_ToggleAutoPush,
+    operators.GITHUB_OT_ToggleWorkBranch,
     operators.GITHUB_OT_Disconnect,
-    operators.GITHUB_OT_SelectRepo,
-    # Panels
+    operators.GITHUB_OT_CancelTask,
+    # Lists and panels
+    ui.GITHUB_UL_Repos,
     ui.GITHUB_PT_MainPanel,
     ui.GITHUB_PT_ReposPanel,
+    ui.GITHUB_PT_NetworkPanel,
 )
 
 def register():
@@ -58,8 +66,13 @@ def register():
     if operators.auto_push_on_save not in bpy.app.handlers.save_post:
         bpy.app.handlers.save_post.append(operators.auto_push_on_save)
 
+    # Deliver results of background network tasks
+    tasks.register()
+
 def unregister():
     """Unregister all classes, properties, and handlers"""
+    tasks.unregister()
+
     # Remove save handler
     if operators.auto_push_on_save in bpy.app.handlers.save_post:
         bpy.app.handlers.save_post.remove(operators.auto_push_on_save)
@@ -69,5 +82,7 @@ def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
+    shutdown_github_client()
+
 if __name__ == "__main__":
     register()
@@ -0,0 +1,333 @@
+"""
+Batch analysis of downloaded submissions for the GitHub Classroom add-on
+Collects per-file statistics (polygons, modifiers, render settings, ...)
+for a folder of .blend files and writes a CSV and a JSON report.
+
+Full analysis runs in a pool of background Blender processes that each
+open many files in turn, so Blender starts once per process rather than
+once per file. Quick analysis only reads the block index of each file
+(see blend_reader.py) and needs no Blender.
+
+Usage:
+    blender --background --factory-startup --python batch_analyzer.py -- --worker
+        Run as a pool worker: read one path per line from stdin and print
+        one RESULT_MARKER line with JSON statistics per file.
+    python batch_analyzer.py [--blender PATH] [--processes N] FOLDER
+        Analyze all .blend files in FOLDER and write the reports there.
+"""
+
+import os
+import sys
+import csv
+import json
+import queue
+import threading
+import subprocess
+from collections import Counter
+from typing import Optional, List, Dict, Any, Callable
+
+if __package__:
+    from .blend_reader import summarize
+else:
+    # Run as a script by Blender or Python
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from blend_reader import summarize
+
+# Prefix of result lines printed by workers; Blender prints other
+# messages to stdout as well
+RESULT_MARKER = "BATCH_ANALYZER_RESULT:"
+
+# Seconds between cancellation checks while waiting for a worker
+WAIT_INTERVAL = 0.5
+
+# Report file names, written to the analyzed folder
+REPORT_CSV = "report.csv"
+REPORT_JSON = "report.json"
+
+REPORT_FIELDS = (
+    'student', 'file', 'file_size', 'blender_version', 'objects', 'meshes',
+    'materials', 'polygons', 'modifiers', 'render_engine', 'resolution',
+    'fps', 'frame_range', 'error',
+)
+
+
+def list_blend_files(folder: str) -> List[str]:
+    """Get the .blend files directly inside folder, sorted by name"""
+    return sorted(
+        os.path.join(folder, name) for name in os.listdir(folder)
+        if name.lower().endswith('.blend')
+    )
+
+
+def worker_command(blender_path: str) -> List[str]:
+    """Get the command line that starts a Blender pool worker"""
+    return [
+        blender_path, '--background', '--factory-startup',
+        '--python', os.path.abspath(__file__), '--', '--worker',
+    ]
+
+
+# --- Worker side (runs inside Blender) ---
+
+def analyze_in_blender(path: str) -> Dict[str, Any]:
+    """Open path in this Blender process and collect its statistics"""
+    import bpy
+
+    result = summarize(path)
+    if 'error' in result:
+        return result
+    bpy.ops.wm.open_mainfile(filepath=path, load_ui=False)
+
+    scene = bpy.context.scene
+    render = scene.render
+    modifiers = Counter()
+    polygons = 0
+    for obj in bpy.data.objects:
+        modifiers.update(modifier.type for modifier in obj.modifiers)
+        if obj.type == 'MESH' and obj.data is not None:
+            polygons += len(obj.data.polygons)
+
+    scale = render.resolution_percentage / 100
+    result.update({
+        'polygons': polygons,
+        'modifiers': dict(modifiers),
+        'render_engine': render.engine,
+        'resolution': [int(render.resolution_x * scale),
+                       int(render.resolution_y * scale)],
+        'fps': render.fps / render.fps_base,
+        'frame_range': [scene.frame_start, scene.frame_end],
+    })
+    return result
+
+
+def run_worker():
+    """Answer analysis requests from stdin until it is closed"""
+    for line in sys.stdin:
+        path = line.rstrip('\n')
+        if not path:
+            continue
+        try:
+            result = analyze_in_blender(path)
+        except Exception as e:
+            result = {'path': path, 'error': str(e)}
+        print(RESULT_MARKER + json.dumps(result), flush=True)
+
+
+# --- Pool side ---
+
+class WorkerPool:
+    """
+    Persistent worker processes that analyze one file per request.
+    Each process is started on first use and kept for the following
+    files; a process that exits is restarted for the next file.
+    """
+
+    def __init__(self, command: List[str], size: int):
+        self.command = command
+        self.size = max(1, size)
+        self._processes: List[Optional[subprocess.Popen]] = [None] * self.size
+        self._closed = False
+
+    def _start(self, slot: int) -> subprocess.Popen:
+        process = subprocess.Popen(
+            self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, bufsize=1
+        )
+        self._processes[slot] = process
+        return process
+
+    def _analyze_one(self, slot: int, path: str) -> Dict[str, Any]:
+        """Send one file to a worker and wait for its result"""
+        process = self._processes[slot]
+        if process is None or process.poll() is not None:
+            try:
+                process = self._start(slot)
+            except (OSError, ValueError) as e:
+                # E.g. no Blender at the given path
+                self._processes[slot] = None
+                return {'path': path,
+                        'error': f"Could not start analysis process: {e}"}
+        try:
+            process.stdin.write(path + '\n')
+            process.stdin.flush()
+            for line in process.stdout:
+                if line.startswith(RESULT_MARKER):
+                    return json.loads(line[len(RESULT_MARKER):])
+        except (OSError, ValueError):
+            pass
+        # The worker exited while handling the file
+        self._processes[slot] = None
+        process.kill()
+        return {'path': path, 'error': "Analysis process stopped"}
+
+    def analyze(self, paths: List[str],
+                progress: Optional[Callable[[int, int], None]] = None
+                ) -> List[Dict[str, Any]]:
+        """
+        Analyze paths, spread over the worker processes.
+        progress(done, total) is called on the calling thread after each
+        file and regularly while waiting; it may raise
+        OperationCancelled, which stops the workers.
+        Returns: list of results in the same order as paths
+        """
+        jobs = queue.Queue()
+        for job in enumerate(paths):
+            jobs.put(job)
+        finished = queue.Queue()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(paths)
+
+        def serve(slot):
+            while not self._closed:
+                try:
+                    index, path = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    results[index] = self._analyze_one(slot, path)
+                except Exception as e:
+                    results[index] = {'path': path, 'error': str(e)}
+                finished.put(index)
+
+        threads = [
+            threading.Thread(target=serve, args=(slot,), daemon=True,
+                             name=f"github-classroom-analyze-{slot}")
+            for slot in range(min(self.size, len(paths)))
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for done in range(1, len(paths) + 1):
+                while True:
+                    try:
+                        finished.get(timeout=WAIT_INTERVAL)
+                        break
+                    except queue.Empty:
+                        # Let progress check for cancellation
+                        if progress is not None:
+                            progress(done - 1, len(paths))
+                if progress is not None:
+                    progress(done, len(paths))
+        except BaseException:
+            self.close(kill=True)
+            raise
+        return results
+
+    def close(self, kill: bool = False):
+        """Stop all worker processes, after their current file unless
+        kill is set"""
+        self._closed = True
+        for slot, process in enumerate(self._processes):
+            if process is None:
+                continue
+            if kill:
+                process.kill()
+            elif process.poll() is None:
+                try:
+                    process.stdin.close()
+                    process.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    process.kill()
+            self._processes[slot] = None
+
+
+def analyze_files(paths: List[str], blender_path: Optional[str] = None,
+                  processes: int = 0,
+                  progress: Optional[Callable[[int, int], None]] = None
+                  ) -> List[Dict[str, Any]]:
+    """
+    Analyze .blend files.
+    With blender_path, files are opened by a pool of background Blender
+    processes (processes of them, 0 for one per CPU core). Without it,
+    only the block index is read, in this process, which takes
+    milliseconds per file.
+    progress(done, total) may raise OperationCancelled to stop.
+    Returns: list of result dicts in the same order as paths
+    """
+    if not blender_path:
+        results = []
+        for done, path in enumerate(paths, 1):
+            results.append(summarize(path))
+            if progress is not None:
+                progress(done, len(paths))
+        return results
+
+    pool = WorkerPool(worker_command(blender_path),
+                      processes or os.cpu_count() or 1)
+    try:
+        return pool.analyze(paths, progress)
+    finally:
+        pool.close()
+
+
+def _report_row(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a result into one report row"""
+    name = os.path.basename(result['path'])
+    counts = result.get('id_counts', {})
+    modifiers = result.get('modifiers') or {}
+    resolution = result.get('resolution')
+    frame_range = result.get('frame_range')
+    return {
+        'student': os.path.splitext(name)[0],
+        'file': name,
+        'file_size': result.get('file_size', ''),
+        'blender_version': result.get('version', ''),
+        'objects': counts.get('OB', 0) if counts else '',
+        'meshes': counts.get('ME', 0) if counts else '',
+        'materials': counts.get('MA', 0) if counts else '',
+        'polygons': result.get('polygons', ''),
+        'modifiers': '; '.join(f"{kind} x{count}"
+                               for kind, count in sorted(modifiers.items())),
+        'render_engine': result.get('render_engine', ''),
+        'resolution': 'x'.join(map(str, resolution)) if resolution else '',
+        'fps': round(result['fps'], 3) if 'fps' in result else '',
+        'frame_range': ('-'.join(map(str, frame_range))
+                        if frame_range else ''),
+        'error': result.get('error', ''),
+    }
+
+
+def write_reports(folder: str, results: List[Dict[str, Any]]) -> List[str]:
+    """
+    Write the CSV and JSON reports of results into folder.
+    Returns: paths of the written reports
+    """
+    csv_path = os.path.join(folder, REPORT_CSV)
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        for result in results:
+            writer.writerow(_report_row(result))
+
+    json_path = os.path.join(folder, REPORT_JSON)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    return [csv_path, json_path]
+
+
+def main(argv: List[str]):
+    """Command-line entry point (see the module docstring)"""
+    if '--worker' in argv:
+        run_worker()
+        return
+
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Analyze the .blend files in a folder"
+    )
+    parser.add_argument('folder')
+    parser.add_argument('--blender', help="Blender executable for full "
+                                          "analysis (default: quick)")
+    parser.add_argument('--processes', type=int, default=0,
+                        help="Blender processes (default: one per core)")
+    args = parser.parse_args(argv)
+
+    paths = list_blend_files(args.folder)
+    results = analyze_files(paths, args.blender, args.processes)
+    for report in write_reports(args.folder, results):
+        print(report)
+
+
+if __name__ == '__main__':
+    # Blender passes the script's own arguments after '--'
+    main(sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv
+         else sys.argv[1:])
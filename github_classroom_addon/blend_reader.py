@@ -0,0 +1,282 @@
+"""
+.blend file reader for the GitHub Classroom add-on
+Reads the file header and block index of a .blend file to summarize
+what it contains (objects, meshes, materials, ...) without Blender.
+Uses only Python standard library (no external dependencies required).
+
+Can also be run as a script: with file paths as arguments, or with one
+path per line on stdin, it prints one JSON summary per line.
+"""
+
+import os
+import sys
+import gzip
+import json
+import mmap
+import struct
+from typing import Optional, Dict, Any, BinaryIO, Iterator
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Bytes read per step when skipping over block data of a compressed file
+SKIP_CHUNK_SIZE = 1024 * 1024
+
+# Block codes of the data-blocks shown in summaries
+ID_NAMES = {
+    'OB': "objects",
+    'ME': "meshes",
+    'MA': "materials",
+    'SC': "scenes",
+    'CA': "cameras",
+    'LA': "lights",
+    'IM': "images",
+    'TE': "textures",
+    'NT': "node groups",
+    'GR': "collections",
+    'AC': "actions",
+    'WO': "worlds",
+    'CU': "curves",
+}
+
+# Blocks that are not data-blocks
+NON_ID_CODES = {'DATA', 'DNA1', 'ENDB', 'GLOB', 'REND', 'TEST', 'USER'}
+
+
+class BlendReadError(Exception):
+    """The file is not a .blend file or cannot be read"""
+
+
+def _zstd_decompressor():
+    """Get a function that opens a zstd stream for reading, or None.
+    Python 3.14 has zstd in the standard library; Blender also bundles
+    the zstandard package."""
+    try:
+        from compression import zstd
+        return lambda f: zstd.ZstdFile(f)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        return lambda f: zstandard.ZstdDecompressor().stream_reader(f)
+    except ImportError:
+        return None
+
+
+def _open_blend(path: str):
+    """
+    Open a .blend file, decompressing it if needed.
+    Returns: (file object, compression name or None)
+    """
+    f = open(path, 'rb')
+    magic = f.read(4)
+    f.seek(0)
+    if magic[:2] == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=f), 'gzip'
+    if magic == ZSTD_MAGIC:
+        opener = _zstd_decompressor()
+        if opener is None:
+            f.close()
+            raise BlendReadError(
+                "File is zstd-compressed and no zstd decoder is available "
+                "(needs Python 3.14 or the zstandard package)"
+            )
+        return opener(f), 'zstd'
+    return f, None
+
+
+def _read_exact(f: BinaryIO, size: int) -> bytes:
+    """
+    Read size bytes, or fewer only at the end of the stream.
+    Decompressing streams may return less than asked for (e.g. at zstd
+    frame boundaries) without having reached the end.
+    """
+    data = f.read(size)
+    while len(data) < size:
+        chunk = f.read(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def _skip(f: BinaryIO, count: int):
+    """Move forward count bytes in a decompressing stream"""
+    while count > 0:
+        size = min(count, SKIP_CHUNK_SIZE)
+        if len(_read_exact(f, size)) < size:
+            raise BlendReadError("File ends in the middle of a block")
+        count -= size
+
+
+def _parse_header(f: BinaryIO) -> Dict[str, Any]:
+    """
+    Parse the file header.
+    Old files: 'BLENDER' + pointer size ('_' 4, '-' 8) + endianness
+    ('v' little, 'V' big) + 3-digit version, e.g. 'BLENDER-v405'.
+    Blender 5.0 and later: 'BLENDER' + 2-digit header size + '-' +
+    2-digit file format version + endianness + 4-digit version,
+    e.g. 'BLENDER17-01v0500'.
+    Returns: dict with 'version', 'pointer_size', 'endian' and the
+             struct format of a block header
+    """
+    head = _read_exact(f, 12)
+    if len(head) < 12 or not head.startswith(b'BLENDER'):
+        raise BlendReadError("Not a .blend file")
+
+    if head[7:9].isdigit():
+        header_size = int(head[7:9])
+        head += _read_exact(f, header_size - 12)
+        if len(head) < header_size or head[9:10] != b'-':
+            raise BlendReadError("Unsupported .blend header")
+        format_version = int(head[10:12])
+        endian_char = head[12:13]
+        version = int(head[13:header_size])
+        if format_version != 1:
+            raise BlendReadError(
+                f"Unsupported .blend format version {format_version}"
+            )
+        pointer_size = 8
+        endian = '<' if endian_char == b'v' else '>'
+        # code, SDNA index, old address, length, count
+        bhead = struct.Struct(f'{endian}4siQqq')
+        fields = ('code', 'sdna', 'old', 'length', 'count')
+    else:
+        pointer_size = 8 if head[7:8] == b'-' else 4
+        endian = '<' if head[8:9] == b'v' else '>'
+        version = int(head[9:12])
+        address = 'Q' if pointer_size == 8 else 'I'
+        # code, length, old address, SDNA index, count
+        bhead = struct.Struct(f'{endian}4si{address}ii')
+        fields = ('code', 'length', 'old', 'sdna', 'count')
+
+    return {
+        'version': f"{version // 100}.{version % 100}",
+        'pointer_size': pointer_size,
+        'endian': 'little' if endian == '<' else 'big',
+        'bhead': bhead,
+        'length_index': fields.index('length'),
+    }
+
+
+def _scan_stream(f: BinaryIO, bhead: struct.Struct,
+                 length_index: int) -> Iterator[bytes]:
+    """Yield the code of each block of a compressed file, reading block
+    headers one by one and skipping block contents"""
+    while True:
+        data = _read_exact(f, bhead.size)
+        if not data:
+            # Files written by very old versions may lack ENDB
+            return
+        if len(data) < bhead.size:
+            raise BlendReadError("File ends in the middle of a block header")
+        fields = bhead.unpack(data)
+        if fields[0] == b'ENDB':
+            return
+        yield fields[0]
+        length = fields[length_index]
+        if length < 0:
+            raise BlendReadError("Corrupt block header")
+        _skip(f, length)
+
+
+def _scan_mapped(f: BinaryIO, bhead: struct.Struct,
+                 length_index: int) -> Iterator[bytes]:
+    """Yield the code of each block of an uncompressed file, unpacking
+    block headers straight from a memory map of the file"""
+    offset = f.tell()
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        end = len(data) - bhead.size
+        while offset <= end:
+            fields = bhead.unpack_from(data, offset)
+            if fields[0] == b'ENDB':
+                return
+            yield fields[0]
+            length = fields[length_index]
+            if length < 0:
+                raise BlendReadError("Corrupt block header")
+            offset += bhead.size + length
+
+
+def read_blend_summary(path: str) -> Dict[str, Any]:
+    """
+    Summarize a .blend file from its block index.
+    Only block headers are read; block contents are skipped.
+    Returns: dict with 'version' (of the Blender that saved the file),
+             'compression', 'pointer_size', 'endian', 'file_size',
+             'blocks', 'datablocks' and 'id_counts' (block code -> count)
+    """
+    f, compression = _open_blend(path)
+    with f:
+        header = _parse_header(f)
+        bhead = header['bhead']
+        length_index = header['length_index']
+        if compression is None:
+            codes = _scan_mapped(f, bhead, length_index)
+        else:
+            codes = _scan_stream(f, bhead, length_index)
+
+        code_counts: Dict[bytes, int] = {}
+        for code in codes:
+            code_counts[code] = code_counts.get(code, 0) + 1
+
+    id_counts = {}
+    for code, count in code_counts.items():
+        name = code.rstrip(b'\0').decode('latin-1')
+        if len(name) == 2 and name not in NON_ID_CODES:
+            id_counts[name] = count
+
+    return {
+        'version': header['version'],
+        'compression': compression,
+        'pointer_size': header['pointer_size'],
+        'endian': header['endian'],
+        'file_size': os.path.getsize(path),
+        'blocks': sum(code_counts.values()),
+        'datablocks': sum(id_counts.values()),
+        'id_counts': id_counts,
+    }
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """Describe a summary in one line, e.g.
+    'Blender 4.2: 3 objects, 2 meshes, 1 materials (41 data-blocks)'"""
+    counts = summary['id_counts']
+    parts = [f"{counts.get(code, 0)} {ID_NAMES[code]}"
+             for code in ('OB', 'ME', 'MA')]
+    return (f"Blender {summary['version']}: {', '.join(parts)} "
+            f"({summary['datablocks']} data-blocks)")
+
+
+def summarize(path: str) -> Dict[str, Any]:
+    """
+    Summarize a .blend file without raising.
+    Returns: the summary with 'path' and 'text' added, or a dict with
+             'path' and 'error'
+    """
+    try:
+        summary = read_blend_summary(path)
+    except (OSError, EOFError, BlendReadError, struct.error) as e:
+        return {'path': path, 'error': str(e)}
+    except Exception as e:
+        # Corrupt compressed data raises decoder-specific errors
+        return {'path': path, 'error': f"Cannot read file: {e}"}
+    summary['path'] = path
+    summary['text'] = format_summary(summary)
+    return summary
+
+
+def main(paths: Optional[list] = None):
+    """Print one JSON summary per line for each path (argv or stdin)"""
+    if paths:
+        lines = paths
+    else:
+        lines = (line.rstrip('\n') for line in sys.stdin)
+    for path in lines:
+        if not path:
+            continue
+        print(json.dumps(summarize(path)), flush=True)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,222 @@
+"""
+Local caches for the GitHub Classroom add-on
+Uses only Python standard library (no external dependencies required).
+"""
+
+import os
+import shutil
+import hashlib
+import threading
+from typing import Optional, List, Dict, Any
+from .metadata_store import MetadataStore
+
+# Default size limit of the API response cache
+DEFAULT_RESPONSE_CACHE_BYTES = 20 * 1024 * 1024
+
+# Default size limit of the downloaded file cache
+DEFAULT_BLOB_CACHE_BYTES = 1024 * 1024 * 1024
+
+
+class ResponseCache:
+    """
+    Cache of GitHub API GET responses, revalidated with ETags.
+
+    Entries live in the shared metadata store with their validators and
+    last use, so all Blender sessions on a machine share them; least
+    recently used entries are evicted once the cache grows beyond
+    max_bytes.
+    """
+
+    def __init__(self, store: MetadataStore,
+                 max_bytes: int = DEFAULT_RESPONSE_CACHE_BYTES):
+        self.store = store
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        # Number of requests answered from the cache (HTTP 304)
+        self.hits = 0
+
+    @staticmethod
+    def make_key(url: str, token: Optional[str],
+                 accept: Optional[str] = None) -> str:
+        """Build a cache key from the URL, media type and token identity.
+        The token itself is never stored, only part of its hash."""
+        token_id = hashlib.sha256((token or '').encode('utf-8')).hexdigest()
+        raw = f"{token_id[:16]}\n{accept or ''}\n{url}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached entry.
+        Returns: dict with 'etag', 'last_modified', 'link' and 'body',
+                 or None
+        """
+        return self.store.get_response(key)
+
+    def touch(self, key: str):
+        """Mark an entry as used after it was revalidated"""
+        with self._lock:
+            self.hits += 1
+        self.store.touch_response(key)
+
+    def put(self, key: str, etag: Optional[str],
+            last_modified: Optional[str], body: bytes,
+            link: Optional[str] = None):
+        """Store a response body with its validators and pagination
+        links"""
+        if len(body) > self.max_bytes:
+            return
+        if not self.store.put_response(key, etag, last_modified, link, body):
+            return
+        if self.store.response_bytes() > self.max_bytes:
+            # Evict down to 80% so we don't evict on every put
+            self.store.evict_responses(int(self.max_bytes * 0.8))
+
+    def clear(self):
+        """Remove all cached responses"""
+        self.store.clear_responses()
+
+
+class BlobCache:
+    """
+    Content-addressed cache of downloaded files, keyed by git blob SHA.
+
+    A blob never changes, so an entry is valid for as long as it exists.
+    Files are stored as <sha[:2]>/<sha>; the modification time is the
+    last use, and least recently used files are evicted once the cache
+    grows beyond max_bytes.
+    """
+
+    def __init__(self, cache_dir: str,
+                 max_bytes: int = DEFAULT_BLOB_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.total_bytes = sum(size for _, size, _ in self._entries())
+
+    def _path(self, sha: str) -> str:
+        return os.path.join(self.cache_dir, sha[:2], sha)
+
+    def _entries(self):
+        """List (mtime, size, path) of all cached files"""
+        entries = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if name.endswith('.tmp'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def contains(self, sha: str) -> bool:
+        return bool(sha) and os.path.exists(self._path(sha))
+
+    @staticmethod
+    def _link_or_copy(source: str, destination: str):
+        """Hard-link source to destination, copying if linking fails"""
+        if os.path.lexists(destination):
+            os.remove(destination)
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copyfile(source, destination)
+
+    def fetch(self, sha: str, destination: str) -> bool:
+        """
+        Place the cached file for sha at destination.
+        Returns: False if sha is not in the cache
+        """
+        path = self._path(sha)
+        try:
+            os.utime(path)
+            self._link_or_copy(path, destination)
+        except OSError:
+            return False
+        return True
+
+    def store(self, sha: str, source: str):
+        """Add a downloaded file (whose content has blob SHA sha)"""
+        path = self._path(sha)
+        if os.path.exists(path):
+            return
+        size = os.path.getsize(source)
+        if size > self.max_bytes:
+            return
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f'{path}.{threading.get_ident()}.tmp'
+        try:
+            self._link_or_copy(source, temp_path)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        with self._lock:
+            self.total_bytes += size
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Remove least recently used files until below the size limit.
+        Must be called with the lock held."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self.total_bytes = total
+
+    def clear(self):
+        """Remove all cached files"""
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self.total_bytes = 0
+
+
+class RepoIndex:
+    """
+    Index of a set of repositories (an organization, or one student's
+    assignments) with the .blend files found in each, kept in the shared
+    metadata store under scope.
+
+    synced_at is the newest updated_at seen by the last refresh: pages of
+    repositories sorted by update time only need to be fetched until
+    they reach it. since is the oldest updated_at the index covers
+    ('' for all repositories). entries maps full_name to {'repo': ..., 'blend_files':
+    [...]}, where blend_files is None if the lookup failed and must be
+    repeated.
+    """
+
+    def __init__(self, store: MetadataStore, scope: str):
+        self.store = store
+        self.scope = scope
+        self.synced_at, self.since, self.entries = store.load_index(scope)
+
+    def save(self):
+        """Write the index to the store"""
+        self.store.save_index(self.scope, self.synced_at, self.since,
+                              self.entries)
+
+    def sorted_entries(self) -> List[Dict[str, Any]]:
+        """Get the entries, most recently updated first"""
+        return sorted(
+            self.entries.values(),
+            key=lambda entry: entry['repo'].get('updated_at') or '',
+            reverse=True
+        )
@@ -5,15 +5,328 @@ Uses only Python standard library (no external dependencies required).
 """
 
 import os
+import re
 import json
-import base64
+import time
+import random
+import hashlib
+import threading
+import http.client
 import urllib.parse
-import urllib.request
 import urllib.error
-from typing import Optional, List, Dict, Any, Tuple
+from concurrent.futures import (
+    ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+)
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterator
+from .transport import ConnectionPool, Base64JSONBody
+from .cache import ResponseCache, BlobCache, RepoIndex
+from .metadata_store import MetadataStore
 
 GITHUB_API_URL = "https://api.github.com"
 
+# Default number of simultaneous requests for bulk operations
+DEFAULT_MAX_WORKERS = 8
+
+# Below this many remaining requests, requests are spread out evenly
+# until the rate limit window resets
+LOW_RATE_LIMIT_BUDGET = 100
+
+# Longest time (seconds) to wait for the rate limit before giving up
+MAX_RATE_LIMIT_WAIT = 60
+
+# Retries for throttled requests (403/429 from a rate limit)
+MAX_THROTTLE_RETRIES = 4
+
+# One page of organization repositories together with the root tree of
+# each default branch, so .blend files are found without extra requests
+ORG_REPOS_GRAPHQL_QUERY = """
+query($org: String!, $cursor: String) {
+  organization(login: $org) {
+    repositories(first: 100, after: $cursor,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        nameWithOwner
+        owner { login }
+        description
+        url
+        updatedAt
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              tree {
+                entries {
+                  name
+                  path
+                  type
+                  oid
+                  object { ... on Blob { byteSize } }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+# Files larger than this are uploaded through the Git Data API (blob,
+# tree, commit, ref) instead of a single contents API request
+LARGE_UPLOAD_THRESHOLD = 10 * 1024 * 1024
+
+# Status message for pushes that were skipped because nothing changed
+UP_TO_DATE_MESSAGE = "Already up to date"
+
+# Autosaves go to the branch AUTOSAVE_BRANCH_PREFIX + <username>
+AUTOSAVE_BRANCH_PREFIX = "autosave/"
+
+# Files at least this large are downloaded as parallel ranged segments
+PARALLEL_DOWNLOAD_THRESHOLD = 8 * 1024 * 1024
+
+# Number of simultaneous ranged requests for one large download
+DOWNLOAD_SEGMENTS = 4
+
+# Attempts to resume a download segment after the connection drops
+DOWNLOAD_RETRIES = 3
+
+# Download read buffer size: starts small and grows while the
+# connection keeps filling it
+MIN_READ_SIZE = 64 * 1024
+MAX_READ_SIZE = 1024 * 1024
+
+# Bytes downloaded between saves of the resume information
+DOWNLOAD_STATE_INTERVAL = 4 * 1024 * 1024
+
+# Seconds between progress updates of bulk downloads
+BULK_PROGRESS_INTERVAL = 0.5
+
+# Errors from a connection that dropped in the middle of a download
+DOWNLOAD_CONNECTION_ERRORS = (
+    ConnectionError, TimeoutError, http.client.HTTPException,
+)
+
+
+def git_blob_sha(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the git blob SHA-1 of a local file (as GitHub reports it)"""
+    digest = hashlib.sha1(b'blob %d\0' % os.path.getsize(path))
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def split_ranges(size: int, parts: int) -> List[List[int]]:
+    """
+    Split size bytes into parts ranges of about equal length.
+    Returns: list of [start, end, bytes_done] with end inclusive
+    """
+    step = -(-size // parts) if parts > 0 else size
+    return [[start, min(start + step, size) - 1, 0]
+            for start in range(0, size, max(step, 1))]
+
+
+def content_range_total(headers) -> Optional[int]:
+    """Get the full file size from a Content-Range header, if known"""
+    value = headers.get('Content-Range') or ''
+    total = value.rpartition('/')[2].strip()
+    return int(total) if total.isdigit() else None
+
+
+def last_page_from_link(link: Optional[str]) -> Optional[int]:
+    """Get the page number of the rel="last" URL in a Link header"""
+    for part in (link or '').split(','):
+        match = re.search(r'<([^>]*)>\s*;\s*rel="last"', part)
+        if match:
+            query = urllib.parse.urlsplit(match.group(1)).query
+            page = urllib.parse.parse_qs(query).get('page')
+            if page and page[0].isdigit():
+                return int(page[0])
+    return None
+
+
+class RepoRecord:
+    """
+    The fields of a GitHub repository that the add-on uses (and keeps in
+    the local repository index). The API's repository objects have
+    around a hundred fields; listings are parsed into records page by
+    page so the full objects are dropped as soon as a page is read.
+    """
+    __slots__ = ('name', 'full_name', 'owner', 'description', 'html_url',
+                 'updated_at', 'pushed_at', 'default_branch')
+
+    def __init__(self, repo: Dict[str, Any]):
+        self.name = repo.get('name') or ''
+        self.full_name = repo.get('full_name') or ''
+        self.owner = (repo.get('owner') or {}).get('login') or ''
+        self.description = repo.get('description')
+        self.html_url = repo.get('html_url') or ''
+        self.updated_at = repo.get('updated_at') or ''
+        self.pushed_at = repo.get('pushed_at')
+        self.default_branch = repo.get('default_branch')
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the record in the layout of the REST API (owner as
+        {'login': ...})"""
+        repo = {field: getattr(self, field) for field in self.__slots__}
+        repo['owner'] = {'login': self.owner}
+        return repo
+
+
+class OperationCancelled(Exception):
+    """Raised by a progress callback to stop a long-running operation"""
+
+
+class RateLimitError(urllib.error.HTTPError):
+    """A request was refused because a GitHub rate limit was reached"""
+
+    def __init__(self, url: str, code: int, headers: Any,
+                 reset_at: Optional[float]):
+        self.reset_at = reset_at
+        if reset_at:
+            reset_time = time.strftime('%H:%M', time.localtime(reset_at))
+            msg = f"GitHub rate limit reached, try again after {reset_time}"
+        else:
+            msg = "GitHub rate limit reached, try again in a few minutes"
+        super().__init__(url, code, msg, headers, None)
+
+
+def describe_http_error(e: urllib.error.HTTPError) -> str:
+    """Describe an HTTP error for status messages"""
+    if isinstance(e, RateLimitError):
+        return e.msg
+    return f"HTTP {e.code}"
+
+
+class RateLimitScheduler:
+    """
+    Keeps requests within GitHub's rate limits.
+    Tracks the X-RateLimit-* headers per resource (core, search, graphql),
+    spaces requests out evenly once the remaining budget runs low, and
+    computes jittered exponential backoff for throttled responses.
+    Safe to share between threads.
+    """
+
+    def __init__(self, low_budget: int = LOW_RATE_LIMIT_BUDGET,
+                 max_wait: float = MAX_RATE_LIMIT_WAIT):
+        self.low_budget = low_budget
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        # resource -> {'limit', 'remaining', 'reset'}
+        self._budgets: Dict[str, Dict[str, int]] = {}
+        self._blocked_until = 0.0
+        self._next_slot = 0.0
+
+    @staticmethod
+    def resource_for(endpoint: str) -> str:
+        """Guess which rate limit resource an API endpoint uses"""
+        if endpoint.startswith('/graphql'):
+            return 'graphql'
+        if endpoint.startswith('/search/'):
+            return 'search'
+        return 'core'
+
+    def update(self, headers: Any):
+        """Record the rate limit headers of a response"""
+        if headers is None:
+            return
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        try:
+            budget = {
+                'limit': int(headers.get('X-RateLimit-Limit', 0)),
+                'remaining': int(remaining),
+                'reset': int(headers.get('X-RateLimit-Reset', 0)),
+            }
+        except ValueError:
+            return
+        resource = headers.get('X-RateLimit-Resource', 'core')
+        with self._lock:
+            self._budgets[resource] = budget
+
+    def wait_for_slot(self, resource: str = 'core'):
+        """
+        Block until another request may be sent.
+        Raises RateLimitError if that would take longer than max_wait.
+        """
+        with self._lock:
+            now = time.time()
+            start = max(now, self._blocked_until)
+            budget = self._budgets.get(resource)
+            reset_at = None
+            if budget and budget['reset'] > now:
+                reset_at = budget['reset']
+                if budget['remaining'] <= 0:
+                    start = max(start, reset_at)
+                elif budget['remaining'] < self.low_budget:
+                    # Spread what is left evenly over the rest of the window
+                    spacing = (reset_at - now) / budget['remaining']
+                    start = max(start, self._next_slot)
+                    self._next_slot = start + spacing
+                    budget['remaining'] -= 1
+
+            wait = start - now
+            if wait > self.max_wait:
+                raise RateLimitError(
+                    f"{GITHUB_API_URL} ({resource})", 403, None,
+                    reset_at or self._blocked_until
+                )
+
+        if wait > 0:
+            time.sleep(wait)
+
+    @staticmethod
+    def is_throttled(e: urllib.error.HTTPError) -> bool:
+        """Check whether an error response comes from a rate limit"""
+        if e.code == 429:
+            return True
+        if e.code != 403 or e.headers is None:
+            return False
+        return (e.headers.get('Retry-After') is not None
+                or e.headers.get('X-RateLimit-Remaining') == '0')
+
+    def backoff(self, e: urllib.error.HTTPError, attempt: int) -> float:
+        """
+        Get the delay before retrying a throttled request, and block
+        other requests for that long as well.
+        """
+        headers = e.headers
+        delay = None
+        retry_after = headers.get('Retry-After') if headers else None
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                delay = None
+        if delay is None and headers is not None:
+            reset = headers.get('X-RateLimit-Reset')
+            if headers.get('X-RateLimit-Remaining') == '0' and reset:
+                delay = max(0.0, int(reset) - time.time())
+        if delay is None:
+            # Exponential backoff with jitter: 1-2s, 2-4s, 4-8s, ...
+            base = 2 ** attempt
+            delay = base + random.uniform(0, base)
+        else:
+            delay += random.uniform(0, 1)
+
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.time() + delay)
+        return delay
+
+    def get_status(self, resource: str = 'core') -> Optional[Dict[str, int]]:
+        """
+        Get the last known budget for a resource.
+        Returns: dict with 'limit', 'remaining' and 'reset' (epoch
+                 seconds), or None if no response has been seen yet
+        """
+        with self._lock:
+            budget = self._budgets.get(resource)
+            return dict(budget) if budget else None
+
 
 class GitHubClassroomClient:
     """Client for interacting with GitHub for classroom assignments"""
@@ -28,6 +341,19 @@ class GitHubClassroomClient:
         )
         self.working_file = None
         self.auto_push = True
+        self.autosave_to_branch = False
+        self._lock = threading.RLock()
+        self._default_branches = {}
+        self.transport = ConnectionPool()
+        self.rate_limiter = RateLimitScheduler()
+        # Shared by all Blender sessions using this config directory
+        self.metadata_store = MetadataStore(
+            os.path.join(self.config_dir, 'metadata.db')
+        )
+        self.response_cache = ResponseCache(self.metadata_store)
+        self.blob_cache = BlobCache(
+            os.path.join(self.config_dir, 'blob_cache')
+        )
         self._load_working_file()
 
     def _get_config_dir(self) -> str:
@@ -38,8 +364,26 @@ class GitHubClassroomClient:
         return config_dir
 
     def _make_request(self, endpoint: str, method: str = 'GET',
-                      data: Optional[Dict] = None) -> Any:
-        """Make an authenticated request to GitHub API"""
+                      data: Optional[Dict] = None,
+                      body: Optional[Base64JSONBody] = None) -> Any:
+        """
+        Make an authenticated request to GitHub API.
+        The JSON payload is either data, or a streaming body (sent with
+        its precomputed Content-Length).
+        GET responses are cached on disk and revalidated with
+        If-None-Match / If-Modified-Since; a 304 (which does not count
+        against the rate limit) is answered from the cache.
+        """
+        return self._request_with_links(endpoint, method, data, body)[0]
+
+    def _request_with_links(self, endpoint: str, method: str = 'GET',
+                            data: Optional[Dict] = None,
+                            body: Optional[Base64JSONBody] = None
+                            ) -> Tuple[Any, Optional[str]]:
+        """
+        Make a request like _make_request.
+        Returns: (decoded response, Link header or None)
+        """
         url = f"{GITHUB_API_URL}{endpoint}"
         headers = {
             'Authorization': f'token {self.token}',
@@ -47,17 +391,92 @@ class GitHubClassroomClient:
             'User-Agent': 'Blender-Classroom-Addon',
         }
         if data is not None:
+            body = json.dumps(data).encode('utf-8')
+        if body is not None:
             headers['Content-Type'] = 'application/json'
+            headers['Content-Length'] = str(len(body))
 
-        req = urllib.request.Request(url, headers=headers, method=method)
-        if data is not None:
-            req.data = json.dumps(data).encode('utf-8')
+        cache_key = None
+        cached = None
+        if method == 'GET':
+            cache_key = ResponseCache.make_key(
+                url, self.token, headers['Accept']
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
 
-        response = urllib.request.urlopen(req)
-        body = response.read().decode('utf-8')
-        if body:
-            return json.loads(body)
-        return None
+        status, response_headers, response_body = self._send(
+            self.transport.request, method, url, headers, body,
+            resource=RateLimitScheduler.resource_for(endpoint)
+        )
+
+        link = response_headers.get('Link')
+        if status == 304 and cached:
+            self.response_cache.touch(cache_key)
+            response_body = cached['body']
+            link = link or cached.get('link')
+        elif cache_key and status == 200:
+            etag = response_headers.get('ETag')
+            last_modified = response_headers.get('Last-Modified')
+            if etag or last_modified:
+                self.response_cache.put(
+                    cache_key, etag, last_modified, response_body, link
+                )
+
+        if response_body:
+            return json.loads(response_body.decode('utf-8')), link
+        return None, link
+
+    def _send(self, send, method: str, url: str, headers: Dict[str, str],
+              body: Optional[bytes] = None, resource: str = 'core') -> Any:
+        """
+        Send a request through the rate limit scheduler.
+        send is transport.request or transport.open. Throttled requests
+        are retried with backoff; RateLimitError is raised when the
+        limit does not clear in time.
+        """
+        attempt = 0
+        while True:
+            self.rate_limiter.wait_for_slot(resource)
+            try:
+                result = send(method, url, headers=headers, body=body)
+            except urllib.error.HTTPError as e:
+                self.rate_limiter.update(e.headers)
+                if not RateLimitScheduler.is_throttled(e):
+                    raise
+                delay = self.rate_limiter.backoff(e, attempt)
+                attempt += 1
+                if (attempt > MAX_THROTTLE_RETRIES
+                        or delay > self.rate_limiter.max_wait):
+                    raise RateLimitError(
+                        url, e.code, e.headers, time.time() + delay
+                    )
+                time.sleep(delay)
+                continue
+
+            response_headers = (result[1] if isinstance(result, tuple)
+                                else result.headers)
+            self.rate_limiter.update(response_headers)
+            return result
+
+    def get_rate_limit(self) -> Optional[Dict[str, int]]:
+        """
+        Get the remaining core API budget.
+        Returns: dict with 'limit', 'remaining' and 'reset', or None
+        """
+        return self.rate_limiter.get_status('core')
+
+    def refresh_rate_limit(self) -> Optional[Dict[str, int]]:
+        """Ask GitHub for the current budget (this call is free)"""
+        try:
+            self._make_request('/rate_limit')
+        except Exception:
+            pass
+        return self.get_rate_limit()
 
     def is_authenticated(self) -> bool:
         """Check if user is authenticated"""
@@ -96,16 +515,19 @@ class GitHubClassroomClient:
             self.username = None
             if e.code == 401:
                 return False, "Invalid token. Please check your token."
-            return False, f"Authentication failed: HTTP {e.code}"
+            return False, f"Authentication failed: {describe_http_error(e)}"
         except Exception as e:
             self.token = None
             self.username = None
             return False, f"Authentication failed: {str(e)}"
 
     def logout(self):
-        """Clear authentication and remove saved token"""
+        """Clear authentication and remove saved token and cached data"""
         if os.path.exists(self.token_file):
             os.remove(self.token_file)
+        self.response_cache.clear()
+        self.blob_cache.clear()
+        self.metadata_store.clear_indexes()
         self.token = None
         self.username = None
         self.clear_working_file()
@@ -114,44 +536,37 @@ class GitHubClassroomClient:
         """
         Get assignment repos for the authenticated user in an organization.
         Used by students to see their own assignment repositories.
+        Repos have the fields of RepoRecord, in the REST layout.
         Returns: (success, repos_list, error_message)
         """
         if not self.is_authenticated():
             return False, [], "Not authenticated"
 
+        org_lower = org_name.lower()
+        username_lower = (self.username or '').lower()
+        if not username_lower:
+            return False, [], "Username not available; please re-authenticate"
+
+        def keep(record):
+            # Only repos in the specified organization whose name
+            # contains the student's username (GitHub Classroom names
+            # them {assignment}-{username}); a student can see many more
+            return (record.owner.lower() == org_lower
+                    and username_lower in record.name.lower())
+
         try:
-            all_repos = []
-            page = 1
-            while True:
-                repos = self._make_request(
-                    f'/user/repos?per_page=100&page={page}'
-                    f'&affiliation=collaborator,organization_member'
-                    f'&sort=updated&direction=desc'
-                )
-                if not repos:
-                    break
-                all_repos.extend(repos)
-                if len(repos) < 100:
-                    break
-                page += 1
-
-            # Filter to repos in the specified organization, then to only
-            # repos whose name contains the student's username
-            # (GitHub Classroom names them {assignment}-{username}).
-            org_lower = org_name.lower()
-            username_lower = (self.username or '').lower()
-            if not username_lower:
-                return False, [], "Username not available; please re-authenticate"
             filtered = [
-                r for r in all_repos
-                if r.get('owner', {}).get('login', '').lower() == org_lower
-                and username_lower in r.get('name', '').lower()
+                record.to_dict() for record in self._iter_repos(
+                    '/user/repos?affiliation=collaborator,organization_member'
+                    '&sort=updated&direction=desc',
+                    keep=keep
+                )
             ]
 
             return True, filtered, ""
 
         except urllib.error.HTTPError as e:
-            return False, [], f"API error: HTTP {e.code}"
+            return False, [], f"API error: {describe_http_error(e)}"
         except Exception as e:
             return False, [], f"Error fetching repos: {str(e)}"
 
@@ -159,36 +574,429 @@ class GitHubClassroomClient:
         """
         Get ALL repos in an organization (for teachers).
         Teachers can see all student assignment repositories in the classroom org.
+        Repos have the fields of RepoRecord, in the REST layout.
         Returns: (success, repos_list, error_message)
         """
         if not self.is_authenticated():
             return False, [], "Not authenticated"
 
         try:
-            all_repos = []
-            page = 1
             encoded_org = urllib.parse.quote(org_name, safe='')
-            while True:
-                repos = self._make_request(
-                    f'/orgs/{encoded_org}/repos?per_page=100&page={page}'
-                    f'&sort=updated&direction=desc'
+            all_repos = [
+                record.to_dict() for record in self._iter_repos(
+                    f'/orgs/{encoded_org}/repos?sort=updated&direction=desc'
                 )
-                if not repos:
-                    break
-                all_repos.extend(repos)
-                if len(repos) < 100:
-                    break
-                page += 1
+            ]
 
             return True, all_repos, ""
 
         except urllib.error.HTTPError as e:
             if e.code == 404:
                 return False, [], f"Organization '{org_name}' not found"
-            return False, [], f"API error: HTTP {e.code}"
+            return False, [], f"API error: {describe_http_error(e)}"
         except Exception as e:
             return False, [], f"Error fetching org repos: {str(e)}"
 
+    def get_org_repos_graphql(
+            self, org_name: str,
+            since: str = '') -> Tuple[bool, List[Dict[str, Any]], str]:
+        """
+        Get ALL repos in an organization using the GraphQL API (for teachers).
+        Each query returns up to 100 repositories together with the root
+        tree of their default branch, so no per-repo requests are needed.
+        With since (an ISO 8601 time), listing stops at repos last updated
+        before it.
+        Repos have the same keys as get_org_repos plus 'blend_files', the
+        .blend files in the repository root (as from find_blend_files).
+        Returns: (success, repos_list, error_message)
+        """
+        if not self.is_authenticated():
+            return False, [], "Not authenticated"
+
+        try:
+            all_repos = []
+            cursor = None
+            while True:
+                result = self._make_request('/graphql', method='POST', data={
+                    'query': ORG_REPOS_GRAPHQL_QUERY,
+                    'variables': {'org': org_name, 'cursor': cursor},
+                })
+                errors = result.get('errors')
+                if errors:
+                    if errors[0].get('type') == 'NOT_FOUND':
+                        return False, [], f"Organization '{org_name}' not found"
+                    return False, [], (
+                        f"API error: {errors[0].get('message', 'GraphQL error')}"
+                    )
+
+                organization = (result.get('data') or {}).get('organization')
+                if organization is None:
+                    return False, [], f"Organization '{org_name}' not found"
+
+                repositories = organization['repositories']
+                reached_since = False
+                for node in repositories.get('nodes') or []:
+                    repo = self._repo_from_graphql(node)
+                    if since and repo['updated_at'] < since:
+                        # Nodes are sorted by update time, newest first
+                        reached_since = True
+                        break
+                    all_repos.append(repo)
+
+                page_info = repositories.get('pageInfo', {})
+                if reached_since or not page_info.get('hasNextPage'):
+                    break
+                cursor = page_info.get('endCursor')
+
+            return True, all_repos, ""
+
+        except urllib.error.HTTPError as e:
+            return False, [], f"API error: {describe_http_error(e)}"
+        except Exception as e:
+            return False, [], f"Error fetching org repos: {str(e)}"
+
+    @staticmethod
+    def _repo_from_graphql(node: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a GraphQL repository node to the REST repo layout"""
+        blend_files = []
+        target = (node.get('defaultBranchRef') or {}).get('target') or {}
+        for entry in (target.get('tree') or {}).get('entries') or []:
+            if entry.get('type') == 'blob' and entry.get('name', '').endswith('.blend'):
+                blend_files.append({
+                    'name': entry['name'],
+                    'path': entry.get('path') or entry['name'],
+                    'sha': entry.get('oid', ''),
+                    'size': (entry.get('object') or {}).get('byteSize', 0),
+                })
+
+        return {
+            'name': node.get('name', ''),
+            'full_name': node.get('nameWithOwner', ''),
+            'owner': {'login': (node.get('owner') or {}).get('login', '')},
+            'description': node.get('description'),
+            'html_url': node.get('url', ''),
+            'updated_at': node.get('updatedAt', ''),
+            'blend_files': blend_files,
+        }
+
+    def _iter_pages(self, endpoint: str,
+                    max_workers: int = DEFAULT_MAX_WORKERS,
+                    until: Optional[Callable[[List[Any]], bool]] = None,
+                    parse: Optional[Callable[[List[Any]], List[Any]]] = None
+                    ) -> Iterator[List[Any]]:
+        """
+        Yield the pages of a paginated list endpoint (100 items per page)
+        in order. Search results ({'items': [...]}) are unwrapped, and
+        parse(page_items), if given, is applied as soon as a page is read
+        so only its result is kept.
+        The rel="last" Link of the first page tells how many pages there
+        are; the rest are then fetched concurrently (at most max_workers
+        at once). With until, pages are fetched one by one instead and
+        paging stops after the first (parsed) page for which until(page)
+        is true.
+        """
+        separator = '&' if '?' in endpoint else '?'
+
+        def fetch(page):
+            page_items, link = self._request_with_links(
+                f'{endpoint}{separator}per_page=100&page={page}'
+            )
+            if isinstance(page_items, dict):
+                page_items = page_items.get('items')
+            page_items = page_items or []
+            full = len(page_items) >= 100
+            if parse is not None:
+                page_items = parse(page_items)
+            return page_items, full, link
+
+        page_items, full, link = fetch(1)
+        yield page_items
+        last_page = last_page_from_link(link)
+        if until is None and last_page and last_page > 2:
+            workers = max(1, min(max_workers, last_page - 1))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for page_items, _, _ in executor.map(fetch,
+                                                     range(2, last_page + 1)):
+                    yield page_items
+            return
+
+        page = 1
+        while full and not (until and until(page_items)):
+            page += 1
+            page_items, full, _ = fetch(page)
+            yield page_items
+
+    def _paginate(self, endpoint: str,
+                  max_workers: int = DEFAULT_MAX_WORKERS) -> List[Any]:
+        """Get all items of a paginated list endpoint (see _iter_pages)"""
+        return [item for page in self._iter_pages(endpoint, max_workers)
+                for item in page]
+
+    def _iter_repos(self, endpoint: str,
+                    keep: Optional[Callable[[RepoRecord], bool]] = None,
+                    max_workers: int = DEFAULT_MAX_WORKERS,
+                    until: Optional[Callable[[List[RepoRecord]], bool]] = None
+                    ) -> Iterator[RepoRecord]:
+        """
+        Yield the repositories of a paginated repository listing as
+        RepoRecords, in order. Each page is parsed and filtered with
+        keep as it arrives. until is passed to _iter_pages and gets each
+        page's records before filtering.
+        """
+        def parse(page_items):
+            return [RepoRecord(repo) for repo in page_items]
+
+        for records in self._iter_pages(endpoint, max_workers, until, parse):
+            for record in records:
+                if keep is None or keep(record):
+                    yield record
+
+    def get_classroom_repos(
+            self, org_name: str,
+            assignment: str = '') -> Tuple[bool, List[Dict[str, Any]], str]:
+        """
+        Get the accepted-assignment repos of the GitHub Classroom
+        classrooms that belong to an organization, using the Classroom
+        API (for classroom admins). Only assignments whose slug equals
+        assignment are used, if given. This is the exact roster: no repo
+        name guessing is involved.
+        Repos have the keys of get_org_repos (without dates) plus
+        'student_login', 'submitted' and 'assignment' (the slug).
+        Returns: (success, repos_list, error_message)
+        """
+        if not self.is_authenticated():
+            return False, [], "Not authenticated"
+
+        org_lower = org_name.lower()
+        try:
+            classrooms = []
+            for classroom in self._paginate('/classrooms'):
+                if classroom.get('archived'):
+                    continue
+                details = self._make_request(f"/classrooms/{classroom['id']}")
+                login = ((details or {}).get('organization') or {}).get('login', '')
+                if login.lower() == org_lower:
+                    classrooms.append(classroom)
+            if not classrooms:
+                return False, [], (
+                    f"No active GitHub Classroom found for '{org_name}'"
+                )
+
+            assignments = [
+                item
+                for classroom in classrooms
+                for item in self._paginate(
+                    f"/classrooms/{classroom['id']}/assignments"
+                )
+                if not assignment
+                or item.get('slug', '').lower() == assignment.lower()
+            ]
+            if not assignments:
+                return False, [], f"Assignment '{assignment}' not found"
+
+            repos = []
+            for item in assignments:
+                accepted = self._paginate(
+                    f"/assignments/{item['id']}/accepted_assignments"
+                )
+                for entry in accepted:
+                    repo = entry.get('repository') or {}
+                    # Classroom repositories have no 'name', only
+                    # 'full_name' (owner/name)
+                    full_name = repo.get('full_name', '')
+                    owner, _, name = full_name.partition('/')
+                    students = entry.get('students') or [{}]
+                    repos.append({
+                        'name': name,
+                        'full_name': full_name,
+                        'owner': {'login': owner},
+                        'description': item.get('title', ''),
+                        'html_url': repo.get('html_url', ''),
+                        'default_branch': repo.get('default_branch'),
+                        'student_login': ', '.join(
+                            student.get('login', '') for student in students
+                        ),
+                        'submitted': bool(entry.get('submitted')),
+                        'assignment': item.get('slug', ''),
+                    })
+            return True, repos, ""
+
+        except urllib.error.HTTPError as e:
+            if e.code in (403, 404) and not isinstance(e, RateLimitError):
+                return False, [], (
+                    "The Classroom API is only available to classroom "
+                    "admins"
+                )
+            return False, [], f"API error: {describe_http_error(e)}"
+        except Exception as e:
+            return False, [], f"Error fetching classroom: {str(e)}"
+
+    def _repo_index(self, scope: str) -> RepoIndex:
+        """Load the repository index of scope for the signed-in user"""
+        return RepoIndex(self.metadata_store,
+                         f"{self.username}:{scope}".lower())
+
+    def _repo_listing(self, org_name: str, student: bool, prefix: str,
+                      since: str) -> Tuple[str, str, Callable[[Dict], bool]]:
+        """
+        Describe a repository listing of sync_repos.
+        Returns: (endpoint, index scope, wanted) where wanted(repo) tells
+                 whether a listed repo belongs in the result
+        """
+        org_lower = org_name.lower()
+        username_lower = (self.username or '').lower()
+        if student:
+            endpoint = ('/user/repos?affiliation=collaborator,'
+                        'organization_member')
+            scope = f"user:{org_lower}"
+        elif prefix:
+            query = urllib.parse.quote(f"org:{org_name} {prefix} in:name")
+            endpoint = f'/search/repositories?q={query}'
+            scope = f"search:{org_lower}:{prefix.lower()}"
+        else:
+            encoded_org = urllib.parse.quote(org_name, safe='')
+            endpoint = f'/orgs/{encoded_org}/repos?type=all'
+            scope = f"org:{org_lower}"
+        name_prefix = f"{prefix.lower()}-" if prefix and not student else ''
+
+        def wanted(repo):
+            name = repo.get('name', '').lower()
+            if student:
+                # Students only see repos named after them in the
+                # organization (GitHub Classroom names them
+                # {assignment}-{username})
+                return (repo.get('owner', {}).get('login', '').lower()
+                        == org_lower and username_lower in name)
+            # The search API also matches the prefix inside names
+            return (name.startswith(name_prefix) and
+                    (repo.get('updated_at') or '') >= since)
+
+        return endpoint, scope, wanted
+
+    def cached_repos(self, org_name: str, student: bool = False,
+                     prefix: str = '', since: str = ''
+                     ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the repos sync_repos returned last time (in this or another
+        Blender session) from the local repo index, without any request.
+        Arguments are as for sync_repos.
+        Returns: repos_list as from sync_repos, or None if this listing
+                 was never loaded (or its index does not cover since)
+        """
+        if not self.is_authenticated():
+            return None
+        _, scope, wanted = self._repo_listing(org_name, student, prefix,
+                                              since)
+        index = self._repo_index(scope)
+        if not index.synced_at or since < index.since:
+            return None
+        return [
+            {**entry['repo'], 'blend_files': entry['blend_files'] or []}
+            for entry in index.sorted_entries() if wanted(entry['repo'])
+        ]
+
+    def sync_repos(self, org_name: str, student: bool = False,
+                   full: bool = False,
+                   max_workers: int = DEFAULT_MAX_WORKERS,
+                   progress: Optional[Callable[[int, int], None]] = None,
+                   prefix: str = '', since: str = ''
+                   ) -> Tuple[bool, List[Dict[str, Any]], Optional[set], str]:
+        """
+        Get the repos of an organization (or, with student, the signed-in
+        student's assignment repos in it) through the local repo index.
+        Pages sorted by update time are only fetched until they reach
+        repositories older than the last refresh, and .blend files are
+        only looked up again for new or changed repositories, so a
+        refresh when nothing changed takes a single request. full
+        rebuilds the index from scratch (this also drops deleted repos).
+        progress is passed to find_blend_files_many.
+        Teachers can narrow the list on the server: prefix keeps repos
+        named '<prefix>-...' and is looked up with the search API (which
+        returns at most 1000 repos), and since (an ISO 8601 time) stops
+        listing at repos last updated before it.
+        Repos have the keys of get_org_repos plus 'blend_files', as from
+        get_org_repos_graphql.
+        Returns: (success, repos_list, changed_full_names, error_message)
+                 where changed_full_names holds the repos that were new
+                 or changed (all of them on the first sync of a scope),
+                 or is None after a full rebuild
+        """
+        if not self.is_authenticated():
+            return False, [], None, "Not authenticated"
+
+        endpoint, scope, wanted = self._repo_listing(org_name, student,
+                                                     prefix, since)
+
+        index = self._repo_index(scope)
+        if full or since < index.since:
+            # A wider date window needs the older repos listed too
+            index.synced_at = ''
+            index.entries = {}
+            index.since = since
+        # Pages only need to go back to the last refresh or the window
+        stop_before = max(index.synced_at, since)
+
+        def reached_stop(records):
+            return not records or records[-1].updated_at < stop_before
+
+        try:
+            # Without a point to stop at, all pages are fetched in parallel
+            fetched = list(self._iter_repos(
+                f'{endpoint}&sort=updated&direction=desc',
+                max_workers=max_workers,
+                until=reached_stop if stop_before else None
+            ))
+        except urllib.error.HTTPError as e:
+            # The search API answers 422 for an unknown organization
+            if e.code in (404, 422) and not student:
+                return False, [], None, f"Organization '{org_name}' not found"
+            return False, [], None, f"API error: {describe_http_error(e)}"
+        except Exception as e:
+            return False, [], None, f"Error fetching repos: {str(e)}"
+
+        changed = []
+        for record in fetched:
+            compact = record.to_dict()
+            if not wanted(compact):
+                continue
+            entry = index.entries.get(record.full_name)
+            if (entry is None or entry['blend_files'] is None
+                    or entry['repo'].get('updated_at') != compact['updated_at']
+                    or entry['repo'].get('pushed_at') != compact['pushed_at']):
+                changed.append(compact)
+            else:
+                entry['repo'] = compact
+        # Repos whose .blend lookup failed last time are tried again
+        known = {repo['full_name'] for repo in changed}
+        changed.extend(
+            entry['repo'] for name, entry in index.entries.items()
+            if entry['blend_files'] is None and name not in known
+            and wanted(entry['repo'])
+        )
+
+        results = self.find_blend_files_many(
+            [(repo['owner']['login'], repo['name']) for repo in changed],
+            max_workers=max_workers, recursive=True, progress=progress
+        )
+        for repo, (success, blend_files, _) in zip(changed, results):
+            index.entries[repo['full_name']] = {
+                'repo': repo,
+                'blend_files': blend_files if success else None,
+            }
+        if fetched:
+            index.synced_at = max(
+                index.synced_at,
+                max(record.updated_at for record in fetched)
+            )
+        index.save()
+
+        repos = [
+            {**entry['repo'], 'blend_files': entry['blend_files'] or []}
+            for entry in index.sorted_entries() if wanted(entry['repo'])
+        ]
+        changed_names = None if full else {repo['full_name'] for repo in changed}
+        return True, repos, changed_names, ""
+
     def is_org_admin(self, org_name: str) -> Tuple[bool, str]:
         """
         Check if the authenticated user is an admin/owner of the organization.
@@ -212,24 +1020,35 @@ class GitHubClassroomClient:
             )
 
         except urllib.error.HTTPError as e:
-            if e.code in (403, 404):
+            if e.code in (403, 404) and not isinstance(e, RateLimitError):
                 return False, (
                     "Teacher access requires organization admin/owner privileges. "
                     "Your account does not have admin access to this organization."
                 )
-            return False, f"Error checking organization membership: HTTP {e.code}"
+            return False, (
+                f"Error checking organization membership: "
+                f"{describe_http_error(e)}"
+            )
         except Exception as e:
             return False, f"Error checking organization membership: {str(e)}"
 
-    def find_blend_files(self, owner: str, repo: str,
-                         path: str = '') -> Tuple[bool, List[Dict[str, Any]], str]:
+    def find_blend_files(self, owner: str, repo: str, path: str = '',
+                         recursive: bool = False,
+                         ref: str = 'HEAD') -> Tuple[bool, List[Dict[str, Any]], str]:
         """
         Find .blend files in a repository.
+        By default only the directory at path is listed (Contents API).
+        With recursive=True the whole tree of ref is fetched in a single
+        Git Trees API request and every .blend file below path is returned,
+        shallowest first. Each entry has 'name', 'path', 'sha' and 'size'.
         Returns: (success, blend_files_list, error_message)
         """
         if not self.is_authenticated():
             return False, [], "Not authenticated"
 
+        if recursive:
+            return self._find_blend_files_in_tree(owner, repo, path, ref)
+
         try:
             encoded_path = urllib.parse.quote(path, safe='/')
             encoded_owner = urllib.parse.quote(owner, safe='')
@@ -251,117 +1070,780 @@ class GitHubClassroomClient:
         except urllib.error.HTTPError as e:
             if e.code == 404:
                 return True, [], ""
-            return False, [], f"API error: HTTP {e.code}"
+            return False, [], f"API error: {describe_http_error(e)}"
         except Exception as e:
             return False, [], f"Error finding files: {str(e)}"
 
+    def _find_blend_files_in_tree(self, owner: str, repo: str, path: str,
+                                  ref: str) -> Tuple[bool, List[Dict[str, Any]], str]:
+        """Find .blend files below path using one recursive tree request"""
+        try:
+            encoded_owner = urllib.parse.quote(owner, safe='')
+            encoded_repo = urllib.parse.quote(repo, safe='')
+            encoded_ref = urllib.parse.quote(ref, safe='')
+            tree = self._make_request(
+                f'/repos/{encoded_owner}/{encoded_repo}/git/trees/'
+                f'{encoded_ref}?recursive=1'
+            )
+
+            prefix = path.strip('/')
+            if prefix:
+                prefix += '/'
+            blend_files = []
+            for entry in tree.get('tree', []):
+                entry_path = entry.get('path', '')
+                if (entry.get('type') == 'blob'
+                        and entry_path.endswith('.blend')
+                        and entry_path.startswith(prefix)):
+                    blend_files.append({
+                        'name': entry_path.rsplit('/', 1)[-1],
+                        'path': entry_path,
+                        'sha': entry.get('sha', ''),
+                        'size': entry.get('size', 0),
+                    })
+
+            # Files closest to the repository root come first
+            blend_files.sort(key=lambda f: (f['path'].count('/'), f['path']))
+            return True, blend_files, ""
+
+        except urllib.error.HTTPError as e:
+            # 404: no such repo/ref, 409: repository is empty
+            if e.code in (404, 409):
+                return True, [], ""
+            return False, [], f"API error: {describe_http_error(e)}"
+        except Exception as e:
+            return False, [], f"Error finding files: {str(e)}"
+
+    def find_blend_files_many(
+            self, repos: List[Tuple[str, str]],
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            recursive: bool = False,
+            progress: Optional[Callable[[int, int], None]] = None
+    ) -> List[Tuple[bool, List[Dict[str, Any]], str]]:
+        """
+        Find .blend files in several repositories concurrently.
+        repos is a list of (owner, repo) pairs; at most max_workers
+        requests run at once. recursive is passed to find_blend_files.
+        progress(done, total) is called on the calling thread as repos
+        finish; it may raise OperationCancelled to stop early.
+        Returns: list of (success, blend_files_list, error_message)
+                 in the same order as repos
+        """
+        if not repos:
+            return []
+
+        results = [None] * len(repos)
+        workers = max(1, min(max_workers, len(repos)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    self.find_blend_files, owner, repo, recursive=recursive
+                ): index
+                for index, (owner, repo) in enumerate(repos)
+            }
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    results[futures[future]] = future.result()
+                    if progress is not None:
+                        progress(done, len(repos))
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        return results
+
+    @staticmethod
+    def _repo_path(owner: str, repo: str) -> str:
+        """Get the API path of a repository"""
+        encoded_owner = urllib.parse.quote(owner, safe='')
+        encoded_repo = urllib.parse.quote(repo, safe='')
+        return f'/repos/{encoded_owner}/{encoded_repo}'
+
+    def _get_default_branch(self, owner: str, repo: str) -> str:
+        """Get the name of a repository's default branch"""
+        key = (owner, repo)
+        if key not in self._default_branches:
+            info = self._make_request(self._repo_path(owner, repo))
+            self._default_branches[key] = info.get('default_branch') or 'main'
+        return self._default_branches[key]
+
+    def _committer(self) -> Dict[str, str]:
+        """Get the author/committer identity used for commits"""
+        committer_name = self.username or 'Blender User'
+        committer_id = self.username or 'blender'
+        return {
+            'name': committer_name,
+            'email': f'{committer_id}@users.noreply.github.com',
+        }
+
+    def get_file_sha(self, owner: str, repo: str,
+                     file_path: str) -> Tuple[bool, str, str]:
+        """
+        Get the current blob SHA of a file in a repository.
+        Returns: (success, sha, error_message)
+        """
+        if not self.is_authenticated():
+            return False, "", "Not authenticated"
+
+        try:
+            encoded_path = urllib.parse.quote(file_path, safe='/')
+            file_info = self._make_request(
+                f'{self._repo_path(owner, repo)}/contents/{encoded_path}'
+            )
+            return True, file_info.get('sha', ''), ""
+
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return False, "", f"File '{file_path}' not found"
+            return False, "", f"API error: {describe_http_error(e)}"
+        except Exception as e:
+            return False, "", f"Error looking up file: {str(e)}"
+
     def download_file(self, owner: str, repo: str, file_path: str,
-                      destination: str) -> Tuple[bool, str]:
+                      destination: str,
+                      progress: Optional[Callable[[int, int], None]] = None,
+                      sha: Optional[str] = None) -> Tuple[bool, str]:
         """
         Download a file from a GitHub repository.
+        With the blob sha of the file, a copy from the local download
+        cache is used when there is one; otherwise the content is streamed
+        straight from the Git blobs API (this also works for files too
+        large for the contents API to return inline) and added to the
+        cache. Without sha the file is looked up first and streamed from
+        its download URL.
+        The download goes to destination + '.part' and is resumed from
+        there if it was interrupted, and large files are fetched as
+        parallel ranged segments when the server supports it. The file
+        only replaces destination once its blob SHA has been verified.
+        progress(bytes_done, total_bytes) is called after each chunk,
+        possibly from several threads; it may raise OperationCancelled to
+        stop the download (the .part file is kept for a later resume).
         Returns: (success, error_message)
         """
         if not self.is_authenticated():
             return False, "Not authenticated"
 
-        try:
-            # Get file info to obtain the download URL
-            encoded_path = urllib.parse.quote(file_path, safe='/')
-            encoded_owner = urllib.parse.quote(owner, safe='')
-            encoded_repo = urllib.parse.quote(repo, safe='')
-            endpoint = f'/repos/{encoded_owner}/{encoded_repo}/contents/{encoded_path}'
-            file_info = self._make_request(endpoint)
-
-            download_url = file_info.get('download_url')
-            if not download_url:
-                return False, "No download URL available for this file"
+        if sha and self.blob_cache.fetch(sha, destination):
+            return True, ""
 
-            # Download the file with authentication
-            req = urllib.request.Request(download_url)
-            req.add_header('Authorization', f'token {self.token}')
-            req.add_header('User-Agent', 'Blender-Classroom-Addon')
+        try:
+            headers = {
+                'Authorization': f'token {self.token}',
+                'User-Agent': 'Blender-Classroom-Addon',
+            }
+            if sha:
+                url = (f"{GITHUB_API_URL}{self._repo_path(owner, repo)}"
+                       f"/git/blobs/{urllib.parse.quote(sha, safe='')}")
+                headers['Accept'] = 'application/vnd.github.raw'
+            else:
+                # Get file info to obtain the download URL
+                encoded_path = urllib.parse.quote(file_path, safe='/')
+                file_info = self._make_request(
+                    f'{self._repo_path(owner, repo)}/contents/{encoded_path}'
+                )
+                url = file_info.get('download_url')
+                if not url:
+                    return False, "No download URL available for this file"
+                sha = file_info.get('sha')
 
-            with urllib.request.urlopen(req) as response:
-                with open(destination, 'wb') as f:
-                    while True:
-                        chunk = response.read(8192)
-                        if not chunk:
-                            break
-                        f.write(chunk)
+            part_path = self._download_resumable(
+                url, headers, destination, sha, progress
+            )
+            if sha and git_blob_sha(part_path) != sha:
+                self._discard_download(part_path)
+                return False, "Downloaded file is corrupt (checksum mismatch)"
 
+            # An existing file is replaced, not overwritten: it may be a
+            # hard link into the cache
+            os.replace(part_path, destination)
+            self._discard_download(part_path)
+            if sha:
+                self.blob_cache.store(sha, destination)
             return True, ""
 
+        except OperationCancelled:
+            raise
         except urllib.error.HTTPError as e:
-            return False, f"Download error: HTTP {e.code}"
+            return False, f"Download error: {describe_http_error(e)}"
         except Exception as e:
             return False, f"Error downloading file: {str(e)}"
 
+    def download_files_many(
+            self, files: List[Tuple[str, str, str, str, str]],
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            progress: Optional[Callable[[int, int, int], None]] = None
+    ) -> List[Tuple[bool, bool, str]]:
+        """
+        Download several files concurrently.
+        files is a list of (owner, repo, file_path, destination, sha);
+        at most max_workers downloads run at once. A file is skipped when
+        destination already exists with blob SHA sha.
+        progress(files_done, files_total, bytes_received) is called on the
+        calling thread as files finish and at least every
+        BULK_PROGRESS_INTERVAL seconds; it may raise OperationCancelled
+        to stop the running downloads.
+        Returns: list of (success, skipped, error_message) in the same
+                 order as files
+        """
+        if not files:
+            return []
+
+        lock = threading.Lock()
+        received = [0]
+        stop = threading.Event()
+
+        def fetch(owner, repo, file_path, destination, sha):
+            try:
+                if (sha and os.path.exists(destination)
+                        and git_blob_sha(destination) == sha):
+                    return True, True, ""
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+            except OSError as e:
+                return False, False, str(e)
+
+            last = [0]
+
+            def count(done, total):
+                if stop.is_set():
+                    raise OperationCancelled()
+                with lock:
+                    received[0] += max(done - last[0], 0)
+                    last[0] = max(done, last[0])
+
+            success, error = self.download_file(
+                owner, repo, file_path, destination, progress=count, sha=sha
+            )
+            return success, False, error
+
+        results = [None] * len(files)
+        workers = max(1, min(max_workers, len(files)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(fetch, *entry): index
+                for index, entry in enumerate(files)
+            }
+            pending = set(futures)
+            done = 0
+            try:
+                while pending:
+                    finished, pending = wait(
+                        pending, timeout=BULK_PROGRESS_INTERVAL,
+                        return_when=FIRST_COMPLETED
+                    )
+                    for future in finished:
+                        results[futures[future]] = future.result()
+                    done += len(finished)
+                    if progress is not None:
+                        with lock:
+                            bytes_received = received[0]
+                        progress(done, len(files), bytes_received)
+            except BaseException:
+                stop.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        return results
+
+    @staticmethod
+    def _discard_download(part_path: str):
+        """Remove a partial download and its progress file"""
+        for path in (part_path, part_path + '.json'):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _download_resumable(self, url: str, headers: Dict[str, str],
+                            destination: str, sha: Optional[str],
+                            progress: Optional[Callable[[int, int], None]]) -> str:
+        """
+        Download url into destination + '.part'.
+        The byte ranges still missing are kept in a .part.json file next
+        to it, so an interrupted download continues where it stopped.
+        Returns: path of the complete .part file
+        """
+        part_path = destination + '.part'
+        state_path = part_path + '.json'
+        key = sha or url
+        state = None
+        try:
+            with open(state_path, 'r') as f:
+                state = json.load(f)
+            if (state.get('key') != key
+                    or os.path.getsize(part_path) != state['size']):
+                state = None
+        except (OSError, ValueError, KeyError):
+            state = None
+
+        lock = threading.RLock()
+        done = [0, 0, 0]  # bytes done, total bytes, bytes since last save
+
+        def save_state():
+            with lock:
+                done[2] = 0
+                if state is None:
+                    return
+                with open(state_path, 'w') as f:
+                    json.dump(state, f)
+
+        def advance(count):
+            with lock:
+                done[0] += count
+                done[2] += count
+                current, total = done[0], done[1]
+                if done[2] >= DOWNLOAD_STATE_INTERVAL:
+                    save_state()
+            if progress is not None:
+                progress(current, total)
+
+        if state is None:
+            self._discard_download(part_path)
+            try:
+                response = self._send(self.transport.open, 'GET', url,
+                                      {**headers, 'Range': 'bytes=0-'})
+            except urllib.error.HTTPError as e:
+                # An empty file has no byte 0 to start from
+                if e.code != 416 or content_range_total(e.headers) != 0:
+                    raise
+                open(part_path, 'wb').close()
+                return part_path
+            with response:
+                size = content_range_total(response.headers)
+                if size == 0:
+                    open(part_path, 'wb').close()
+                    return part_path
+                if response.status != 206 or size is None:
+                    # No range support: one plain download, which starts
+                    # over if it is interrupted
+                    done[1] = int(response.headers.get('Content-Length') or 0)
+                    with open(part_path, 'wb') as f:
+                        self._read_range(response, f, None, advance)
+                    if done[1] and done[0] != done[1]:
+                        raise ConnectionError("Connection closed before the "
+                                              "download finished")
+                    return part_path
+
+                parts = (DOWNLOAD_SEGMENTS
+                         if size >= PARALLEL_DOWNLOAD_THRESHOLD else 1)
+                state = {'key': key, 'size': size,
+                         'segments': split_ranges(size, parts)}
+                with open(part_path, 'wb') as f:
+                    f.truncate(size)
+                save_state()
+                done[1] = size
+                # This response already covers the first segment
+                try:
+                    self._read_segment(response, part_path,
+                                       state['segments'][0], advance)
+                except DOWNLOAD_CONNECTION_ERRORS:
+                    pass
+                finally:
+                    save_state()
+        else:
+            done[0] = sum(segment[2] for segment in state['segments'])
+            done[1] = state['size']
+
+        pending = [segment for segment in state['segments']
+                   if segment[2] < segment[1] - segment[0] + 1]
+        try:
+            if len(pending) == 1:
+                self._download_segment(url, headers, part_path, pending[0],
+                                       advance, save_state)
+            elif pending:
+                with ThreadPoolExecutor(
+                        max_workers=len(pending),
+                        thread_name_prefix='github-classroom-download') as pool:
+                    futures = [
+                        pool.submit(self._download_segment, url, headers,
+                                    part_path, segment, advance, save_state)
+                        for segment in pending
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
+        finally:
+            save_state()
+        return part_path
+
+    def _download_segment(self, url: str, headers: Dict[str, str],
+                          part_path: str, segment: List[int],
+                          advance: Callable[[int], None],
+                          save_state: Callable[[], None]):
+        """Fetch the rest of one [start, end, bytes_done] segment, resuming
+        after dropped connections"""
+        start, end, _ = segment
+        for attempt in range(DOWNLOAD_RETRIES + 1):
+            range_header = f'bytes={start + segment[2]}-{end}'
+            try:
+                response = self._send(self.transport.open, 'GET', url,
+                                      {**headers, 'Range': range_header})
+                with response:
+                    if response.status != 206:
+                        raise ConnectionError("Server no longer supports "
+                                              "resuming this download")
+                    self._read_segment(response, part_path, segment, advance)
+                return
+            except DOWNLOAD_CONNECTION_ERRORS:
+                save_state()
+                if attempt == DOWNLOAD_RETRIES:
+                    raise
+
+    def _read_segment(self, response, part_path: str, segment: List[int],
+                      advance: Callable[[int], None]):
+        """Write a ranged response into its segment of the .part file"""
+        start, end, _ = segment
+        # Unbuffered, so the saved progress never runs ahead of the file
+        with open(part_path, 'r+b', buffering=0) as f:
+            f.seek(start + segment[2])
+            remaining = end - start + 1 - segment[2]
+
+            def count(length):
+                segment[2] += length
+                advance(length)
+
+            self._read_range(response, f, remaining, count)
+        if segment[2] < end - start + 1:
+            raise ConnectionError("Connection closed before the download "
+                                  "finished")
+
+    @staticmethod
+    def _read_range(response, f, limit: Optional[int],
+                    advance: Callable[[int], None]):
+        """Copy up to limit bytes (all if None) of response into f.
+        The read size doubles while the connection keeps filling it."""
+        read_size = MIN_READ_SIZE
+        while limit is None or limit > 0:
+            size = read_size if limit is None else min(read_size, limit)
+            chunk = response.read(size)
+            if not chunk:
+                break
+            f.write(chunk)
+            if limit is not None:
+                limit -= len(chunk)
+            advance(len(chunk))
+            if len(chunk) == size:
+                read_size = min(read_size * 2, MAX_READ_SIZE)
+
     def upload_file(self, owner: str, repo: str, file_path: str,
                     local_path: str,
                     message: str = "Save from Blender") -> Tuple[bool, str]:
         """
         Upload or update a file in a GitHub repository (creates a commit).
-        Returns: (success, error_message)
+        For the working file, the blob SHA of the version on GitHub is
+        known from its last push or download, so a push is a single
+        request; the SHA is only looked up when GitHub reports that the
+        file has changed since (409/422), and the push is then repeated.
+        Nothing is sent when the file matches the version on GitHub.
+        Returns: (success, message) where message is the error, or
+                 UP_TO_DATE_MESSAGE when the push was skipped
         """
         if not self.is_authenticated():
             return False, "Not authenticated"
 
         try:
-            # Read the local file and base64 encode it
-            with open(local_path, 'rb') as f:
-                content = base64.b64encode(f.read()).decode('utf-8')
+            local_sha = git_blob_sha(local_path)
+            remote_sha = self._get_remote_sha(owner, repo, file_path)
+            if remote_sha is None:
+                # Not the working file: look up its SHA (needed for updates)
+                remote_sha = self._lookup_remote_sha(owner, repo, file_path)
+
+            for attempt in range(2):
+                if remote_sha == local_sha:
+                    self._set_remote_sha(owner, repo, file_path, local_sha)
+                    return True, UP_TO_DATE_MESSAGE
+                try:
+                    new_sha = self._upload(owner, repo, file_path,
+                                           local_path, message, remote_sha)
+                    break
+                except urllib.error.HTTPError as e:
+                    # 409: remote_sha is out of date; 422: the file was
+                    # created since. Someone else pushed (another Blender
+                    # session or the web editor), so push on top of it.
+                    if e.code not in (409, 422) or attempt:
+                        raise
+                remote_sha = self._lookup_remote_sha(owner, repo, file_path)
+
+            self._set_remote_sha(owner, repo, file_path, new_sha or local_sha)
+            return True, ""
+
+        except urllib.error.HTTPError as e:
+            return False, f"Upload error: {describe_http_error(e)}"
+        except Exception as e:
+            return False, f"Error uploading file: {str(e)}"
+
+    def _lookup_remote_sha(self, owner: str, repo: str,
+                           file_path: str) -> Optional[str]:
+        """
+        Get the blob SHA of a file on GitHub.
+        Returns: the SHA, or None if the file cannot be found
+        """
+        encoded_path = urllib.parse.quote(file_path, safe='/')
+        try:
+            existing = self._make_request(
+                f'{self._repo_path(owner, repo)}/contents/{encoded_path}'
+            )
+            return existing.get('sha')
+        except urllib.error.HTTPError:
+            return None
+
+    def _upload(self, owner: str, repo: str, file_path: str,
+                local_path: str, message: str,
+                sha: Optional[str]) -> Optional[str]:
+        """
+        Commit local_path as file_path, replacing the version with blob
+        SHA sha (None to create the file).
+        Returns: the blob SHA of the uploaded file, if GitHub reported it
+        """
+        if os.path.getsize(local_path) > LARGE_UPLOAD_THRESHOLD:
+            try:
+                return self._upload_via_git_data(
+                    owner, repo, file_path, local_path, message
+                )
+            except urllib.error.HTTPError as e:
+                # 409: the repository is empty, which only the
+                # contents API can handle
+                if e.code != 409:
+                    raise
+
+        # Create or update the file. The file is base64-encoded into the
+        # JSON body while it is sent, never held in memory whole.
+        fields = {
+            'message': message,
+            'committer': self._committer(),
+        }
+        if sha:
+            fields['sha'] = sha
+
+        encoded_path = urllib.parse.quote(file_path, safe='/')
+        body = Base64JSONBody(fields, 'content', local_path)
+        try:
+            result = self._make_request(
+                f'{self._repo_path(owner, repo)}/contents/{encoded_path}',
+                method='PUT',
+                body=body
+            )
+        finally:
+            body.close()
+        return ((result or {}).get('content') or {}).get('sha')
+
+    def _upload_via_git_data(self, owner: str, repo: str, file_path: str,
+                             local_path: str, message: str) -> str:
+        """
+        Upload a large file as a blob and commit it to the default branch.
+        Returns: the blob SHA
+        """
+        blob_sha = self._upload_blob(owner, repo, local_path)
+        branch = self._get_default_branch(owner, repo)
+        self._commit_blob(owner, repo, file_path, blob_sha, message, branch)
+        return blob_sha
+
+    def _commit_blob(self, owner: str, repo: str, file_path: str,
+                     blob_sha: str, message: str, branch: str) -> str:
+        """
+        Commit an uploaded blob at file_path on top of branch
+        (tree, commit and ref update).
+        Returns: the new commit SHA
+        """
+        repo_path = self._repo_path(owner, repo)
+        ref_path = f"heads/{urllib.parse.quote(branch, safe='/')}"
+
+        for attempt in range(2):
+            ref = self._make_request(f'{repo_path}/git/ref/{ref_path}')
+            commit_sha = self._create_commit(
+                owner, repo, file_path, blob_sha, message,
+                ref['object']['sha']
+            )
 
-            # Check if file already exists to get its SHA (needed for updates)
-            sha = None
-            encoded_path = urllib.parse.quote(file_path, safe='/')
-            encoded_owner = urllib.parse.quote(owner, safe='')
-            encoded_repo = urllib.parse.quote(repo, safe='')
             try:
-                existing = self._make_request(
-                    f'/repos/{encoded_owner}/{encoded_repo}/contents/{encoded_path}'
+                self._make_request(
+                    f'{repo_path}/git/refs/{ref_path}', method='PATCH',
+                    data={'sha': commit_sha}
                 )
-                sha = existing.get('sha')
-            except urllib.error.HTTPError:
-                pass
-
-            # Create or update the file
-            committer_name = self.username or 'Blender User'
-            committer_id = self.username or 'blender'
-            data = {
+                return commit_sha
+            except urllib.error.HTTPError as e:
+                # 422: the branch moved since it was read; commit again
+                # on top of the new head
+                if e.code != 422 or attempt:
+                    raise
+
+    def _create_commit(self, owner: str, repo: str, file_path: str,
+                       blob_sha: str, message: str, parent_sha: str) -> str:
+        """
+        Create a commit that changes file_path to an uploaded blob on top
+        of parent_sha (no branch is updated).
+        Returns: the new commit SHA
+        """
+        repo_path = self._repo_path(owner, repo)
+        parent = self._make_request(f'{repo_path}/git/commits/{parent_sha}')
+        tree = self._make_request(
+            f'{repo_path}/git/trees', method='POST', data={
+                'base_tree': parent['tree']['sha'],
+                'tree': [{
+                    'path': file_path,
+                    'mode': '100644',
+                    'type': 'blob',
+                    'sha': blob_sha,
+                }],
+            }
+        )
+        commit = self._make_request(
+            f'{repo_path}/git/commits', method='POST', data={
                 'message': message,
-                'content': content,
-                'committer': {
-                    'name': committer_name,
-                    'email': f'{committer_id}@users.noreply.github.com',
-                },
+                'tree': tree['sha'],
+                'parents': [parent_sha],
+                'author': self._committer(),
+                'committer': self._committer(),
             }
-            if sha:
-                data['sha'] = sha
+        )
+        return commit['sha']
 
-            self._make_request(
-                f'/repos/{encoded_owner}/{encoded_repo}/contents/{encoded_path}',
-                method='PUT',
-                data=data
+    def _upload_blob(self, owner: str, repo: str, local_path: str) -> str:
+        """Upload a file as a Git blob; Returns: the blob SHA"""
+        body = Base64JSONBody(
+            {'encoding': 'base64'}, 'content', local_path
+        )
+        try:
+            blob = self._make_request(
+                f'{self._repo_path(owner, repo)}/git/blobs',
+                method='POST', body=body
+            )
+        finally:
+            body.close()
+        return blob['sha']
+
+    # --- Work branch autosave ---
+
+    def work_branch(self) -> str:
+        """Get the name of the signed-in student's autosave branch"""
+        return f"{AUTOSAVE_BRANCH_PREFIX}{self.username}"
+
+    def _work_ref(self, owner: str, repo: str) -> str:
+        """Get the API path of the work branch reference"""
+        branch = urllib.parse.quote(self.work_branch(), safe='/')
+        return f'{self._repo_path(owner, repo)}/git/refs/heads/{branch}'
+
+    def autosave_file(self, owner: str, repo: str, file_path: str,
+                      local_path: str,
+                      message: str = "Autosave from Blender"
+                      ) -> Tuple[bool, str]:
+        """
+        Push a file to the student's work branch instead of the default
+        branch. The branch always holds a single commit on top of the
+        default branch and is force-moved to a new one on every
+        autosave, so earlier autosaved versions are dropped rather than
+        kept in the repository history. submit_file hands the work in.
+        An empty repository has no default branch to build on; the file
+        is then pushed with upload_file.
+        Returns: (success, message) as from upload_file
+        """
+        if not self.is_authenticated():
+            return False, "Not authenticated"
+
+        try:
+            local_sha = git_blob_sha(local_path)
+            if local_sha in (self._get_working_value(owner, repo, file_path,
+                                                     'autosave_sha'),
+                             self._get_remote_sha(owner, repo, file_path)):
+                return True, UP_TO_DATE_MESSAGE
+
+            repo_path = self._repo_path(owner, repo)
+            try:
+                blob_sha = self._upload_blob(owner, repo, local_path)
+                branch = urllib.parse.quote(
+                    self._get_default_branch(owner, repo), safe='/'
+                )
+                head = self._make_request(f'{repo_path}/git/ref/heads/{branch}')
+            except urllib.error.HTTPError as e:
+                # 409: the repository is empty
+                if e.code != 409:
+                    raise
+                return self.upload_file(owner, repo, file_path, local_path,
+                                        message)
+
+            commit_sha = self._create_commit(
+                owner, repo, file_path, blob_sha, message,
+                head['object']['sha']
             )
+            try:
+                self._make_request(
+                    self._work_ref(owner, repo), method='PATCH',
+                    data={'sha': commit_sha, 'force': True}
+                )
+            except urllib.error.HTTPError as e:
+                # 422 (or 404): the work branch does not exist yet
+                if e.code not in (404, 422):
+                    raise
+                self._make_request(
+                    f'{repo_path}/git/refs', method='POST',
+                    data={'ref': f'refs/heads/{self.work_branch()}',
+                          'sha': commit_sha}
+                )
 
+            self._set_working_value(owner, repo, file_path, 'autosave_sha',
+                                    blob_sha)
             return True, ""
 
         except urllib.error.HTTPError as e:
-            return False, f"Upload error: HTTP {e.code}"
+            return False, f"Autosave error: {describe_http_error(e)}"
         except Exception as e:
-            return False, f"Error uploading file: {str(e)}"
+            return False, f"Error autosaving file: {str(e)}"
+
+    def submit_file(self, owner: str, repo: str, file_path: str,
+                    local_path: str,
+                    message: str = "Submit from Blender") -> Tuple[bool, str]:
+        """
+        Hand in a file: commit it to the default branch as a single
+        commit and delete the student's work branch. When the file is
+        the last autosaved version, its blob is already on GitHub and is
+        committed without uploading it again.
+        Returns: (success, message) as from upload_file
+        """
+        if not self.is_authenticated():
+            return False, "Not authenticated"
+
+        try:
+            local_sha = git_blob_sha(local_path)
+            autosave_sha = self._get_working_value(owner, repo, file_path,
+                                                   'autosave_sha')
+            if (local_sha == autosave_sha
+                    and local_sha != self._get_remote_sha(owner, repo,
+                                                          file_path)):
+                self._commit_blob(owner, repo, file_path, local_sha, message,
+                                  self._get_default_branch(owner, repo))
+                self._set_remote_sha(owner, repo, file_path, local_sha)
+                result = (True, "")
+            else:
+                result = self.upload_file(owner, repo, file_path, local_path,
+                                          message)
+                if not result[0]:
+                    return result
+
+            try:
+                self._make_request(self._work_ref(owner, repo),
+                                   method='DELETE')
+            except urllib.error.HTTPError as e:
+                # 404/422: there is no work branch (nothing was autosaved)
+                if e.code not in (404, 422):
+                    raise
+            self._set_working_value(owner, repo, file_path, 'autosave_sha',
+                                    None)
+            return result
+
+        except urllib.error.HTTPError as e:
+            return False, f"Submit error: {describe_http_error(e)}"
+        except Exception as e:
+            return False, f"Error submitting file: {str(e)}"
 
     # --- Working file management (for auto-push on save) ---
 
     def set_working_file(self, repo_owner: str, repo_name: str,
-                         file_path: str):
-        """Set the current working file info for auto-push"""
-        self.working_file = {
-            'repo_owner': repo_owner,
-            'repo_name': repo_name,
-            'file_path': file_path,
-        }
-        self._save_working_file()
+                         file_path: str, remote_sha: Optional[str] = None):
+        """Set the current working file info for auto-push.
+        remote_sha is the blob SHA of the downloaded version, if known."""
+        with self._lock:
+            self.working_file = {
+                'repo_owner': repo_owner,
+                'repo_name': repo_name,
+                'file_path': file_path,
+            }
+            if remote_sha:
+                self.working_file['remote_sha'] = remote_sha
+            self._save_working_file()
 
     def get_working_file(self) -> Optional[Dict[str, str]]:
         """Get the current working file info"""
@@ -369,21 +1851,70 @@ class GitHubClassroomClient:
 
     def clear_working_file(self):
         """Clear the current working file info"""
-        self.working_file = None
-        if os.path.exists(self.working_file_config):
-            os.remove(self.working_file_config)
+        with self._lock:
+            self.working_file = None
+            if os.path.exists(self.working_file_config):
+                os.remove(self.working_file_config)
+
+    def _is_working_file(self, owner: str, repo: str, file_path: str) -> bool:
+        """Check whether a repository file is the current working file"""
+        working = self.working_file
+        return bool(working) and (
+            working.get('repo_owner') == owner
+            and working.get('repo_name') == repo
+            and working.get('file_path') == file_path
+        )
+
+    def _get_working_value(self, owner: str, repo: str, file_path: str,
+                           name: str) -> Optional[str]:
+        """Get a value remembered for the working file, or None if the
+        file is not the working file"""
+        with self._lock:
+            if self._is_working_file(owner, repo, file_path):
+                return self.working_file.get(name)
+        return None
+
+    def _set_working_value(self, owner: str, repo: str, file_path: str,
+                           name: str, value: Optional[str]):
+        """Remember a value for the working file (if it is the working
+        file)"""
+        with self._lock:
+            if self._is_working_file(owner, repo, file_path):
+                self.working_file[name] = value
+                self._save_working_file()
+
+    def _get_remote_sha(self, owner: str, repo: str,
+                        file_path: str) -> Optional[str]:
+        """Get the blob SHA of the working file on GitHub, as of its last
+        push or download"""
+        return self._get_working_value(owner, repo, file_path, 'remote_sha')
+
+    def _set_remote_sha(self, owner: str, repo: str, file_path: str,
+                        sha: str):
+        """Remember the blob SHA of the working file on GitHub"""
+        self._set_working_value(owner, repo, file_path, 'remote_sha', sha)
 
     def set_auto_push(self, enabled: bool):
         """Enable or disable auto-push on save"""
-        self.auto_push = enabled
-        self._save_working_file()
+        with self._lock:
+            self.auto_push = enabled
+            self._save_working_file()
+
+    def set_autosave_to_branch(self, enabled: bool):
+        """Choose whether auto-push goes to the work branch (see
+        autosave_file) or straight to the default branch"""
+        with self._lock:
+            self.autosave_to_branch = enabled
+            self._save_working_file()
 
     def _save_working_file(self):
         """Save working file info to config"""
-        if self.working_file:
-            data = {**self.working_file, 'auto_push': self.auto_push}
-            with open(self.working_file_config, 'w') as f:
-                json.dump(data, f)
+        with self._lock:
+            if self.working_file:
+                data = {**self.working_file, 'auto_push': self.auto_push,
+                        'autosave_to_branch': self.autosave_to_branch}
+                with open(self.working_file_config, 'w') as f:
+                    json.dump(data, f)
 
     def _load_working_file(self):
         """Load working file info from config"""
@@ -392,6 +1923,12 @@ class GitHubClassroomClient:
                 with open(self.working_file_config, 'r') as f:
                     data = json.load(f)
                     self.auto_push = data.pop('auto_push', True)
+                    self.autosave_to_branch = data.pop('autosave_to_branch',
+                                                       False)
+                    # Saved by earlier versions
+                    if 'last_pushed_sha' in data:
+                        data.setdefault('remote_sha',
+                                        data.pop('last_pushed_sha'))
                     self.working_file = data
             except (json.JSONDecodeError, IOError):
                 self.working_file = None
@@ -399,11 +1936,21 @@ class GitHubClassroomClient:
 
 # Global client instance
 _github_client_instance = None
+_github_client_lock = threading.Lock()
 
 
 def get_github_client() -> GitHubClassroomClient:
-    """Get or create the global GitHub client instance"""
+    """Get or create the global GitHub client instance (thread-safe)"""
     global _github_client_instance
     if _github_client_instance is None:
-        _github_client_instance = GitHubClassroomClient()
+        with _github_client_lock:
+            if _github_client_instance is None:
+                _github_client_instance = GitHubClassroomClient()
     return _github_client_instance
+
+
+def shutdown_github_client():
+    """Close open connections of the global client (on add-on unregister)"""
+    if _github_client_instance is not None:
+        _github_client_instance.transport.close_all()
+        _github_client_instance.metadata_store.close()
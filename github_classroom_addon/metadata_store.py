@@ -0,0 +1,277 @@
+"""
+Shared metadata store for the GitHub Classroom add-on
+A SQLite database in the config directory holding cached API responses
+with their ETags and the repository index (repo listings and the .blend
+files found in each, with their blob SHAs).
+
+The database uses write-ahead logging, so the Blender sessions running
+on one machine read it concurrently while one of them writes, and every
+session (or a later restart) starts from what the others loaded.
+Uses only Python standard library (no external dependencies required).
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Optional, List, Dict, Any, Tuple
+
+# Seconds to wait for another session's write to finish
+BUSY_TIMEOUT = 10.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    link TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at);
+CREATE TABLE IF NOT EXISTS repo_indexes (
+    scope TEXT PRIMARY KEY,
+    synced_at TEXT NOT NULL,
+    since TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS repos (
+    scope TEXT NOT NULL,
+    full_name TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    blend_files TEXT,
+    PRIMARY KEY (scope, full_name)
+);
+"""
+
+
+class MetadataStore:
+    """
+    SQLite store shared by all Blender sessions using one config
+    directory. Safe to share between threads.
+
+    Failing to read or write (e.g. while another session holds a long
+    write) is not an error: reads then miss and writes are dropped,
+    like with any cache.
+    """
+
+    def __init__(self, path: str, timeout: float = BUSY_TIMEOUT):
+        self.path = path
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        with self._lock:
+            try:
+                self._connection()
+            except sqlite3.Error:
+                # E.g. locked by another session that is creating it;
+                # opening is retried on the next use
+                pass
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Get the open connection, opening it if needed. Must be called
+        with the lock held.
+        Raises: sqlite3.Error if the database cannot be opened now
+        """
+        if self._conn is None:
+            try:
+                self._conn = self._connect()
+            except sqlite3.OperationalError:
+                # Locked or unreadable for now; the files may be in use
+                # by other sessions, so they are left alone
+                raise
+            except sqlite3.DatabaseError:
+                # Not a database (e.g. a damaged file): start over
+                self._remove_files()
+                self._conn = self._connect()
+        return self._conn
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(
+            self.path, timeout=self.timeout, isolation_level=None,
+            check_same_thread=False
+        )
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(SCHEMA)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def _remove_files(self):
+        for suffix in ('', '-wal', '-shm'):
+            try:
+                os.remove(self.path + suffix)
+            except OSError:
+                pass
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """Run a read query; Returns: all rows, or [] on failure"""
+        with self._lock:
+            try:
+                return self._connection().execute(sql, params).fetchall()
+            except sqlite3.Error:
+                return []
+
+    def _write(self, statements: List[Tuple[str, Any]]) -> bool:
+        """
+        Run (sql, params) statements in one transaction; params may be a
+        list of tuples for executemany.
+        Returns: True if the transaction was committed
+        """
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute('BEGIN IMMEDIATE')
+            except sqlite3.Error:
+                return False
+            try:
+                for sql, params in statements:
+                    if isinstance(params, list):
+                        conn.executemany(sql, params)
+                    else:
+                        conn.execute(sql, params)
+                conn.execute('COMMIT')
+                return True
+            except sqlite3.Error:
+                try:
+                    conn.execute('ROLLBACK')
+                except sqlite3.Error:
+                    pass
+                return False
+
+    # --- API responses ---
+
+    def get_response(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response.
+        Returns: dict with 'etag', 'last_modified', 'link' and 'body',
+                 or None
+        """
+        rows = self._query(
+            'SELECT etag, last_modified, link, body FROM responses '
+            'WHERE key = ?', (key,)
+        )
+        if not rows:
+            return None
+        etag, last_modified, link, body = rows[0]
+        return {'etag': etag, 'last_modified': last_modified, 'link': link,
+                'body': bytes(body)}
+
+    def put_response(self, key: str, etag: Optional[str],
+                     last_modified: Optional[str], link: Optional[str],
+                     body: bytes) -> bool:
+        """Store a response; Returns: True if it was stored"""
+        return self._write([(
+            'INSERT OR REPLACE INTO responses '
+            '(key, etag, last_modified, link, body, size, used_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (key, etag, last_modified, link, sqlite3.Binary(body), len(body),
+             time.time())
+        )])
+
+    def touch_response(self, key: str):
+        """Mark a response as used"""
+        self._write([('UPDATE responses SET used_at = ? WHERE key = ?',
+                      (time.time(), key))])
+
+    def response_bytes(self) -> int:
+        """Get the total size of the cached response bodies"""
+        rows = self._query('SELECT COALESCE(SUM(size), 0) FROM responses')
+        return rows[0][0] if rows else 0
+
+    def evict_responses(self, target_bytes: int):
+        """Remove least recently used responses until their total size
+        is at most target_bytes"""
+        rows = self._query('SELECT key, size FROM responses '
+                           'ORDER BY used_at DESC')
+        total = 0
+        evicted = []
+        for key, size in rows:
+            total += size
+            if total > target_bytes:
+                evicted.append((key,))
+        if evicted:
+            self._write([('DELETE FROM responses WHERE key = ?', evicted)])
+
+    def clear_responses(self):
+        """Remove all cached responses"""
+        self._write([('DELETE FROM responses', ())])
+
+    # --- Repository index ---
+
+    def load_index(self, scope: str
+                   ) -> Tuple[str, str, Dict[str, Dict[str, Any]]]:
+        """
+        Get the repository index of a scope.
+        Returns: (synced_at, since, entries) as described in RepoIndex;
+                 ('', '', {}) if the scope was never saved
+        """
+        # One snapshot, so a concurrent save is not seen half-done
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute('BEGIN')
+                try:
+                    header = conn.execute(
+                        'SELECT synced_at, since FROM repo_indexes '
+                        'WHERE scope = ?', (scope,)
+                    ).fetchone()
+                    rows = conn.execute(
+                        'SELECT full_name, repo, blend_files FROM repos '
+                        'WHERE scope = ?', (scope,)
+                    ).fetchall()
+                finally:
+                    conn.execute('COMMIT')
+            except sqlite3.Error:
+                return '', '', {}
+
+        if header is None:
+            return '', '', {}
+        entries = {}
+        for full_name, repo, blend_files in rows:
+            try:
+                entries[full_name] = {
+                    'repo': json.loads(repo),
+                    'blend_files': (json.loads(blend_files)
+                                    if blend_files is not None else None),
+                }
+            except ValueError:
+                continue
+        return header[0], header[1], entries
+
+    def save_index(self, scope: str, synced_at: str, since: str,
+                   entries: Dict[str, Dict[str, Any]]) -> bool:
+        """Replace the repository index of a scope; Returns: True if it
+        was saved"""
+        rows = [
+            (scope, full_name, json.dumps(entry['repo']),
+             json.dumps(entry['blend_files'])
+             if entry['blend_files'] is not None else None)
+            for full_name, entry in entries.items()
+        ]
+        return self._write([
+            ('INSERT OR REPLACE INTO repo_indexes (scope, synced_at, since) '
+             'VALUES (?, ?, ?)', (scope, synced_at, since)),
+            ('DELETE FROM repos WHERE scope = ?', (scope,)),
+            ('INSERT INTO repos (scope, full_name, repo, blend_files) '
+             'VALUES (?, ?, ?, ?)', rows),
+        ])
+
+    def clear_indexes(self):
+        """Remove all repository indexes"""
+        self._write([('DELETE FROM repo_indexes', ()),
+                     ('DELETE FROM repos', ())])
+
+    def close(self):
+        """Close the database connection; it is opened again when next
+        used"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -4,9 +4,29 @@ Operator classes for GitHub Classroom Blender add-on
 
 import bpy
 import os
+import time
 import tempfile
 from bpy.types import Operator
-from .github_client import get_github_client
+from . import tasks
+from .github_client import get_github_client, UP_TO_DATE_MESSAGE
+from .blend_reader import summarize
+from .batch_analyzer import list_blend_files, analyze_files, write_reports
+
+
+def _task_is_running(operator):
+    """Report and return True if another GitHub operation is running"""
+    task = tasks.get_active_task()
+    if task is None:
+        return False
+    operator.report({'WARNING'}, f"Please wait: {task.name} is still running")
+    return True
+
+
+def _show_task_error(task, prefix):
+    """Show the unexpected exception of a finished task in the panel"""
+    tasks.update_status(
+        status_message="", error_message=f"{prefix}: {task.error}"
+    )
 
 
 class GITHUB_OT_Authenticate(Operator):
@@ -19,27 +39,47 @@ class GITHUB_OT_Authenticate(Operator):
         props = context.scene.github_classroom
         client = get_github_client()
 
+        if _task_is_running(self):
+            return {'CANCELLED'}
+
         token = props.github_token
         props.status_message = "Signing in..."
         props.error_message = ""
 
-        success, message = client.authenticate(token or None)
-
-        if success:
-            props.is_authenticated = True
-            props.github_username = client.username or ""
-            props.status_message = message
-            # Auto-refresh repos if org is set
-            if props.github_org:
-                bpy.ops.github_class.refresh_repos()
-        else:
-            props.is_authenticated = False
-            props.error_message = message
-            self.report({'ERROR'}, message)
+        def work(task):
+            result = client.authenticate(token or None)
+            if result[0]:
+                client.refresh_rate_limit()
+            return result
 
+        tasks.start_task("Sign in", work, _authenticate_done)
         return {'FINISHED'}
 
 
+def _authenticate_done(task):
+    """Apply the sign-in result (main thread)"""
+    if task.error:
+        _show_task_error(task, "Authentication failed")
+        return
+
+    props = bpy.context.scene.github_classroom
+    client = get_github_client()
+    success, message = task.result
+
+    if success:
+        props.is_authenticated = True
+        props.github_username = client.username or ""
+        props.status_message = message
+        # Auto-refresh repos if org is set
+        if props.github_org:
+            bpy.ops.github_class.refresh_repos()
+    else:
+        props.is_authenticated = False
+        props.status_message = ""
+        props.error_message = message
+    tasks.redraw_panels()
+
+
 class GITHUB_OT_Logout(Operator):
     """Logout from GitHub"""
     bl_idname = "github_class.logout"
@@ -50,11 +90,13 @@ class GITHUB_OT_Logout(Operator):
         props = context.scene.github_classroom
         client = get_github_client()
 
+        tasks.cancel_all()
         client.logout()
         props.is_authenticated = False
         props.github_username = ""
         props.github_token = ""
         props.github_repos.clear()
+        props.repos_revision += 1
         props.show_repos = False
         props.status_message = "Signed out"
         props.error_message = ""
@@ -68,6 +110,13 @@ class GITHUB_OT_RefreshRepos(Operator):
     bl_label = "Load Assignments"
     bl_description = "Load assignment repositories from GitHub Classroom"
 
+    full_refresh: bpy.props.BoolProperty(
+        name="Full Refresh",
+        description="Reload every repository instead of only the ones "
+                    "that changed since the last refresh",
+        default=False
+    )
+
     def execute(self, context):
         props = context.scene.github_classroom
         client = get_github_client()
@@ -82,53 +131,213 @@ class GITHUB_OT_RefreshRepos(Operator):
             self.report({'ERROR'}, "Organization name is required")
             return {'CANCELLED'}
 
+        if _task_is_running(self):
+            return {'CANCELLED'}
+
         props.status_message = "Loading repositories..."
         props.error_message = ""
 
-        # Teachers see all org repos, students see only their own
-        if props.role == 'TEACHER':
-            is_admin, admin_error = client.is_org_admin(props.github_org)
-            if not is_admin:
-                props.error_message = admin_error
-                self.report({'ERROR'}, admin_error)
-                return {'CANCELLED'}
-            success, repos, error = client.get_org_repos(props.github_org)
-        else:
-            success, repos, error = client.get_repos(props.github_org)
-
-        if success:
-            props.github_repos.clear()
-            for repo in repos:
-                item = props.github_repos.add()
-                item.repo_name = repo.get('name', '')
-                item.full_name = repo.get('full_name', '')
-                item.owner = repo.get('owner', {}).get('login', '')
-                item.description = repo.get('description', '') or ''
-                item.html_url = repo.get('html_url', '')
-                updated = repo.get('updated_at', '')
-                if updated:
-                    item.updated_at = updated[:10]
-
-                # Check for .blend files in the repo
-                blend_success, blend_files, _ = client.find_blend_files(
-                    item.owner, item.repo_name
+        role = props.role
+        org = props.github_org
+        teacher_source = props.teacher_source
+        max_workers = props.max_concurrent_requests
+        full = self.full_refresh
+        # Teachers can load just one assignment and/or recent repos
+        prefix = props.assignment_name.strip() if role == 'TEACHER' else ""
+        since = ""
+        if role == 'TEACHER' and props.updated_within_days:
+            start = time.time() - props.updated_within_days * 86400
+            since = time.strftime('%Y-%m-%dT00:00:00Z', time.gmtime(start))
+
+        # Show the list saved by the last load (in any Blender session)
+        # right away; the task then only applies what changed since
+        if not full and (role == 'STUDENT' or teacher_source == 'REST'):
+            cached = client.cached_repos(org, student=role == 'STUDENT',
+                                         prefix=prefix, since=since)
+            if cached:
+                _show_repos(props, cached, None)
+                props.status_message = (f"Showing {len(cached)} saved "
+                                        f"repositories, checking for "
+                                        f"changes...")
+
+        def work(task):
+            return _load_repos(
+                task, client, role, org, teacher_source, max_workers, full,
+                prefix, since
+            )
+
+        tasks.start_task("Loading repositories", work, _refresh_repos_done)
+        return {'FINISHED'}
+
+
+def _load_repos(task, client, role, org, teacher_source, max_workers, full,
+                prefix="", since=""):
+    """
+    Fetch repositories and their .blend files (worker thread).
+    Teachers' repos can be narrowed to names starting with prefix and
+    to repos updated since an ISO 8601 time.
+    Returns: (success, repos_list, blend_results, changed_full_names,
+              error_message); changed_full_names is None if the whole
+              list must be rebuilt
+    """
+    def progress(done, total):
+        task.check_cancelled()
+        task.report(f"Checking for .blend files ({done}/{total})...")
+
+    # Teachers see all org repos, students see only their own
+    if role == 'TEACHER':
+        is_admin, admin_error = client.is_org_admin(org)
+        if not is_admin:
+            return False, [], [], None, admin_error
+        task.check_cancelled()
+        if teacher_source == 'GRAPHQL':
+            success, repos, error = client.get_org_repos_graphql(org, since)
+            # GraphQL cannot search by name; filter the loaded repos
+            repos = [repo for repo in repos if not prefix
+                     or repo['name'].lower().startswith(f"{prefix.lower()}-")]
+            changed = None
+        elif teacher_source == 'CLASSROOM':
+            success, repos, error = client.get_classroom_repos(org, prefix)
+            changed = None
+            if success:
+                task.check_cancelled()
+                results = client.find_blend_files_many(
+                    [(repo['owner']['login'], repo['name']) for repo in repos],
+                    max_workers=max_workers, recursive=True,
+                    progress=progress
                 )
-                if blend_success and blend_files:
-                    item.has_blend_file = True
-                    item.blend_file_path = blend_files[0].get('path', '')
-                    item.blend_file_name = blend_files[0].get('name', '')
-
-            props.show_repos = True
-            count = len(repos)
-            if props.role == 'TEACHER':
-                props.status_message = f"Found {count} student repositories"
-            else:
-                props.status_message = f"Found {count} assignments"
+                for repo, (_, blend_files, _) in zip(repos, results):
+                    repo['blend_files'] = blend_files
         else:
-            props.error_message = error
-            self.report({'ERROR'}, error)
+            success, repos, changed, error = client.sync_repos(
+                org, full=full, max_workers=max_workers, progress=progress,
+                prefix=prefix, since=since
+            )
+    else:
+        success, repos, changed, error = client.sync_repos(
+            org, student=True, full=full, max_workers=max_workers,
+            progress=progress
+        )
 
-        return {'FINISHED'}
+    if not success:
+        return False, [], [], None, error
+
+    # All backends list each repo's .blend files
+    results = [(True, repo['blend_files'], "") for repo in repos]
+    return True, repos, results, changed, ""
+
+
+def _fill_repo_item(item, repo, blend_result):
+    """Copy a repository and its .blend lookup result into a list item"""
+    item.repo_name = repo.get('name', '')
+    item.full_name = repo.get('full_name', '')
+    item.owner = repo.get('owner', {}).get('login', '')
+    item.description = repo.get('description', '') or ''
+    item.html_url = repo.get('html_url', '')
+    updated = repo.get('updated_at', '')
+    item.updated_at = updated[:10] if updated else ''
+    item.student_login = repo.get('student_login', '')
+    if 'submitted' in repo:
+        item.submitted = repo['submitted']
+
+    blend_success, blend_files, _ = blend_result
+    sha = blend_files[0].get('sha', '') if blend_success and blend_files else ""
+    if item.blend_file_sha != sha:
+        # The summary describes the previous version of the file
+        item.summary = ""
+    if blend_success and blend_files:
+        item.has_blend_file = True
+        item.blend_file_path = blend_files[0].get('path', '')
+        item.blend_file_name = blend_files[0].get('name', '')
+        item.blend_file_sha = sha
+        item.blend_file_size = blend_files[0].get('size', 0)
+    else:
+        item.has_blend_file = False
+        item.blend_file_path = ""
+        item.blend_file_name = ""
+        item.blend_file_sha = ""
+        item.blend_file_size = 0
+
+
+def _patch_repo_items(collection, repos, results, changed):
+    """
+    Update the repository list in place: items of unchanged repos are
+    kept as they are, changed ones are refilled, new ones added, removed
+    ones deleted, and the list is put in the order of repos.
+    """
+    positions = {repo.get('full_name', ''): i for i, repo in enumerate(repos)}
+    for index in reversed(range(len(collection))):
+        if collection[index].full_name not in positions:
+            collection.remove(index)
+
+    existing = {item.full_name for item in collection}
+    for repo, result in zip(repos, results):
+        name = repo.get('full_name', '')
+        if name not in existing:
+            _fill_repo_item(collection.add(), repo, result)
+        elif changed is None or name in changed:
+            for item in collection:
+                if item.full_name == name:
+                    _fill_repo_item(item, repo, result)
+                    break
+
+    # Put the items in the order of repos
+    for target, repo in enumerate(repos):
+        name = repo.get('full_name', '')
+        if collection[target].full_name != name:
+            for index in range(target + 1, len(collection)):
+                if collection[index].full_name == name:
+                    collection.move(index, target)
+                    break
+
+
+def _show_repos(props, repos, changed, results=None):
+    """
+    Put repositories into the list, keeping the selected one selected.
+    results are the .blend lookup results of repos; by default they are
+    taken from each repo's 'blend_files'.
+    """
+    if results is None:
+        results = [(True, repo['blend_files'], "") for repo in repos]
+
+    active_name = ""
+    if 0 <= props.active_repo_index < len(props.github_repos):
+        active_name = props.github_repos[props.active_repo_index].full_name
+
+    _patch_repo_items(props.github_repos, repos, results, changed)
+    props.repos_revision += 1
+
+    props.active_repo_index = -1
+    for index, item in enumerate(props.github_repos):
+        if active_name and item.full_name == active_name:
+            props.active_repo_index = index
+            break
+
+    props.show_repos = True
+
+
+def _refresh_repos_done(task):
+    """Update the repository list from the loaded data (main thread)"""
+    if task.error:
+        _show_task_error(task, "Error loading repositories")
+        return
+
+    props = bpy.context.scene.github_classroom
+    success, repos, results, changed, error = task.result
+
+    if success:
+        _show_repos(props, repos, changed, results)
+        count = len(repos)
+        if props.role == 'TEACHER':
+            props.status_message = f"Found {count} student repositories"
+        else:
+            props.status_message = f"Found {count} assignments"
+        if changed is not None and len(changed) < count:
+            props.status_message += f" ({len(changed)} updated)"
+    else:
+        props.status_message = ""
+        props.error_message = error
+    tasks.redraw_panels()
 
 
 class GITHUB_OT_OpenFile(Operator):
@@ -157,6 +366,9 @@ class GITHUB_OT_OpenFile(Operator):
             self.report({'ERROR'}, "No .blend file found in this repository")
             return {'CANCELLED'}
 
+        if _task_is_running(self):
+            return {'CANCELLED'}
+
         props.status_message = "Downloading file..."
         props.error_message = ""
 
@@ -164,39 +376,90 @@ class GITHUB_OT_OpenFile(Operator):
         temp_dir = tempfile.gettempdir()
         download_path = os.path.join(temp_dir, repo_item.blend_file_name)
 
-        success, error = client.download_file(
-            repo_item.owner, repo_item.repo_name,
-            repo_item.blend_file_path, download_path
-        )
+        # Copy what the worker needs; Blender data must not be used
+        # from another thread
+        owner = repo_item.owner
+        repo_name = repo_item.repo_name
+        file_path = repo_item.blend_file_path
+        file_name = repo_item.blend_file_name
+        track_working_file = props.role == 'STUDENT'
+        client.blob_cache.max_bytes = props.download_cache_mb * 1024 * 1024
+
+        def work(task):
+            def progress(done, total):
+                task.check_cancelled()
+                if total:
+                    percent = done * 100 // total
+                    task.report(f"Downloading {file_name} ({percent}%)...")
+
+            # The current SHA decides whether a cached copy can be used
+            success, sha, error = client.get_file_sha(
+                owner, repo_name, file_path
+            )
+            if not success:
+                return False, error, None
+            task.check_cancelled()
+            success, error = client.download_file(
+                owner, repo_name, file_path, download_path,
+                progress=progress, sha=sha
+            )
+            return success, error, sha
 
-        if success:
-            # Save blend_file_name before open_mainfile frees the scene.
-            # Do NOT access props or repo_item after open_mainfile.
-            blend_file_name = repo_item.blend_file_name
-
-            # Track working file for auto-push (students only)
-            if props.role == 'STUDENT':
-                client.set_working_file(
-                    repo_item.owner,
-                    repo_item.repo_name,
-                    repo_item.blend_file_path
-                )
+        def on_done(task):
+            if task.error:
+                _show_task_error(task, "Error downloading file")
+                return
+
+            success, error, sha = task.result
+            if not success:
+                tasks.update_status(status_message="", error_message=error)
+                return
 
+            # Track working file for auto-push (students only); the
+            # downloaded SHA lets the next push skip looking it up
+            if track_working_file:
+                client.set_working_file(owner, repo_name, file_path, sha)
+
+            # Scene properties are freed by open_mainfile; only use
+            # local variables afterwards
             bpy.ops.wm.open_mainfile(filepath=download_path)
-            # Scene properties are now freed; only use local variables
-            self.report({'INFO'}, f"Opened {blend_file_name}")
-        else:
-            props.error_message = error
-            self.report({'ERROR'}, error)
+            tasks.update_status(status_message=f"Opened {file_name}")
 
+        tasks.start_task("Download", work, on_done)
         return {'FINISHED'}
 
 
-class GITHUB_OT_PushFile(Operator):
-    """Save and push current file to GitHub"""
-    bl_idname = "github_class.push_file"
-    bl_label = "Save & Push to GitHub"
-    bl_description = "Save your work and push it to your GitHub repository"
+def _student_name(repo_name, assignment):
+    """Get the student part of a repository named <assignment>-<student>"""
+    prefix = f"{assignment}-"
+    if assignment and repo_name.startswith(prefix) and repo_name != prefix:
+        return repo_name[len(prefix):]
+    return repo_name
+
+
+def _submissions_folder(props):
+    """Get the folder that downloaded submissions of this assignment go to"""
+    if props.submissions_dir:
+        base = bpy.path.abspath(props.submissions_dir)
+    else:
+        base = os.path.join(os.path.expanduser("~"), "Classroom Submissions")
+    return os.path.join(base, props.assignment_name or props.github_org)
+
+
+def format_speed(bytes_per_second):
+    """Format a transfer rate for status messages"""
+    if bytes_per_second >= 1024 * 1024:
+        return f"{bytes_per_second / (1024 * 1024):.1f} MB/s"
+    return f"{bytes_per_second / 1024:.0f} KB/s"
+
+
+class GITHUB_OT_DownloadAllSubmissions(Operator):
+    """Download the .blend file of every student repository"""
+    bl_idname = "github_class.download_all_submissions"
+    bl_label = "Download All Submissions"
+    bl_description = ("Download every student's .blend file into the "
+                      "assignment folder, skipping files that are "
+                      "already up to date")
 
     def execute(self, context):
         props = context.scene.github_classroom
@@ -207,44 +470,287 @@ class GITHUB_OT_PushFile(Operator):
             self.report({'ERROR'}, "Please sign in first")
             return {'CANCELLED'}
 
-        working = client.get_working_file()
-        if not working:
-            props.error_message = (
-                "No assignment file loaded. "
-                "Click \"Open Assignment\" first to connect "
-                "to your GitHub repository."
-            )
-            self.report({'ERROR'}, "No assignment file loaded")
+        folder = _submissions_folder(props)
+        files = []
+        for item in props.github_repos:
+            if not item.has_blend_file:
+                continue
+            if (props.assignment_name and not item.repo_name.startswith(
+                    f"{props.assignment_name}-")):
+                continue
+            student = (item.student_login
+                       or _student_name(item.repo_name, props.assignment_name))
+            destination = os.path.join(folder, f"{student}.blend")
+            files.append((item.owner, item.repo_name, item.blend_file_path,
+                          destination, item.blend_file_sha))
+
+        if not files:
+            self.report({'ERROR'}, "No submissions with a .blend file loaded")
+            return {'CANCELLED'}
+
+        if _task_is_running(self):
             return {'CANCELLED'}
 
-        if not bpy.data.filepath:
-            self.report(
-                {'ERROR'}, "Please save your file first (File > Save As)"
+        props.status_message = f"Downloading {len(files)} submissions..."
+        props.error_message = ""
+        max_workers = props.max_concurrent_downloads
+        client.blob_cache.max_bytes = props.download_cache_mb * 1024 * 1024
+
+        def work(task):
+            started = time.monotonic()
+
+            def progress(done, total, received):
+                task.check_cancelled()
+                elapsed = max(time.monotonic() - started, 0.001)
+                speed = format_speed(received / elapsed)
+                task.report(
+                    f"Downloading submissions {done}/{total} ({speed})..."
+                )
+
+            results = client.download_files_many(
+                files, max_workers=max_workers, progress=progress
             )
+            # Reading the block index takes milliseconds per file
+            summaries = [summarize(entry[3]) if result[0] else None
+                         for entry, result in zip(files, results)]
+            return results, summaries
+
+        def on_done(task):
+            if task.error:
+                _show_task_error(task, "Error downloading submissions")
+                return
+
+            results, summaries = task.result
+            texts = {entry[1]: summary.get('text') or summary.get('error')
+                     for entry, summary in zip(files, summaries) if summary}
+            for item in bpy.context.scene.github_classroom.github_repos:
+                if item.repo_name in texts:
+                    item.summary = texts[item.repo_name]
+
+            failed = [(entry[1], error) for entry, (success, _, error)
+                      in zip(files, results) if not success]
+            skipped = sum(1 for _, was_skipped, _ in results if was_skipped)
+            downloaded = len(files) - len(failed) - skipped
+            message = f"Downloaded {downloaded} submissions"
+            if skipped:
+                message += f" ({skipped} already up to date)"
+            errors = "; ".join(f"{repo}: {error}" for repo, error in failed)
+            tasks.update_status(
+                status_message=f"{message} to {folder}",
+                error_message=(f"{len(failed)} downloads failed: {errors}"
+                               if failed else "")
+            )
+
+        tasks.start_task("Download submissions", work, on_done)
+        return {'FINISHED'}
+
+
+class GITHUB_OT_AnalyzeSubmissions(Operator):
+    """Analyze the downloaded submissions and write a report"""
+    bl_idname = "github_class.analyze_submissions"
+    bl_label = "Analyze Submissions"
+    bl_description = ("Collect statistics of every downloaded submission "
+                      "into report.csv and report.json in the assignment "
+                      "folder")
+
+    def execute(self, context):
+        props = context.scene.github_classroom
+
+        folder = _submissions_folder(props)
+        if not os.path.isdir(folder) or not list_blend_files(folder):
+            self.report({'ERROR'}, "Download the submissions first")
             return {'CANCELLED'}
 
-        # Save the current file
-        bpy.ops.wm.save_mainfile()
+        if _task_is_running(self):
+            return {'CANCELLED'}
 
-        props.status_message = "Pushing to GitHub..."
+        props.status_message = "Analyzing submissions..."
         props.error_message = ""
+        blender_path = (bpy.app.binary_path
+                        if props.analysis_mode == 'FULL' else None)
+        processes = props.analysis_processes
+        assignment = props.assignment_name
+
+        def work(task):
+            def progress(done, total):
+                task.check_cancelled()
+                task.report(f"Analyzing submissions ({done}/{total})...")
+
+            results = analyze_files(
+                list_blend_files(folder), blender_path, processes, progress
+            )
+            return results, write_reports(folder, results)
+
+        def on_done(task):
+            if task.error:
+                _show_task_error(task, "Error analyzing submissions")
+                return
+
+            results, reports = task.result
+            texts = {}
+            for result in results:
+                student = os.path.splitext(os.path.basename(result['path']))[0]
+                text = result.get('text') or result.get('error', '')
+                if 'polygons' in result:
+                    text += f", {result['polygons']} polygons"
+                texts[student] = text
+            for item in bpy.context.scene.github_classroom.github_repos:
+                student = (item.student_login
+                           or _student_name(item.repo_name, assignment))
+                if student in texts:
+                    item.summary = texts[student]
+
+            tasks.update_status(
+                status_message=f"Analyzed {len(results)} submissions: "
+                               f"see {reports[0]}"
+            )
+
+        tasks.start_task("Analyze submissions", work, on_done)
+        return {'FINISHED'}
+
 
-        file_name = os.path.basename(bpy.data.filepath)
-        success, error = client.upload_file(
-            working['repo_owner'],
-            working['repo_name'],
-            working['file_path'],
-            bpy.data.filepath,
-            message=f"Update {file_name} from Blender"
+def _save_working_file(operator, props, client):
+    """
+    Check that the current file can be pushed and save it.
+    Returns: the working file info, or None (with the error reported)
+    """
+    if not client.is_authenticated():
+        props.error_message = "Please sign in first"
+        operator.report({'ERROR'}, "Please sign in first")
+        return None
+
+    working = client.get_working_file()
+    if not working:
+        props.error_message = (
+            "No assignment file loaded. "
+            "Click \"Open Assignment\" first to connect "
+            "to your GitHub repository."
         )
+        operator.report({'ERROR'}, "No assignment file loaded")
+        return None
 
-        if success:
-            props.status_message = "Pushed to GitHub successfully!"
-            self.report({'INFO'}, "Pushed to GitHub successfully!")
-        else:
-            props.error_message = error
-            self.report({'ERROR'}, error)
+    if not bpy.data.filepath:
+        operator.report(
+            {'ERROR'}, "Please save your file first (File > Save As)"
+        )
+        return None
+
+    if _task_is_running(operator):
+        return None
+
+    # Save the current file; the operator pushes it, so the auto-push
+    # queued by saving is dropped
+    bpy.ops.wm.save_mainfile()
+    _auto_push_queue.discard(_auto_push_key(working))
+    return working
+
+
+class GITHUB_OT_PushFile(Operator):
+    """Save and push current file to GitHub"""
+    bl_idname = "github_class.push_file"
+    bl_label = "Save & Push to GitHub"
+    bl_description = "Save your work and push it to your GitHub repository"
+
+    def execute(self, context):
+        props = context.scene.github_classroom
+        client = get_github_client()
+
+        working = _save_working_file(self, props, client)
+        if working is None:
+            return {'CANCELLED'}
 
+        props.status_message = "Pushing to GitHub..."
+        props.error_message = ""
+
+        filepath = bpy.data.filepath
+        file_name = os.path.basename(filepath)
+
+        def work(task):
+            # An auto-push of the file that already started must finish
+            # first, or both would upload it
+            _auto_push_queue.wait(_auto_push_key(working))
+            return client.upload_file(
+                working['repo_owner'],
+                working['repo_name'],
+                working['file_path'],
+                filepath,
+                message=f"Update {file_name} from Blender"
+            )
+
+        def on_done(task):
+            if task.error:
+                _show_task_error(task, "Error uploading file")
+                return
+
+            success, error = task.result
+            if success and error == UP_TO_DATE_MESSAGE:
+                tasks.update_status(
+                    status_message="Nothing to push: already up to date"
+                )
+            elif success:
+                tasks.update_status(
+                    status_message="Pushed to GitHub successfully!"
+                )
+            else:
+                tasks.update_status(status_message="", error_message=error)
+
+        tasks.start_task("Push", work, on_done)
+        return {'FINISHED'}
+
+
+class GITHUB_OT_SubmitFile(Operator):
+    """Save the current file and hand it in"""
+    bl_idname = "github_class.submit_file"
+    bl_label = "Submit"
+    bl_description = ("Save your work and hand it in: it is committed to "
+                      "your repository once and your autosave branch is "
+                      "removed")
+
+    def execute(self, context):
+        props = context.scene.github_classroom
+        client = get_github_client()
+
+        working = _save_working_file(self, props, client)
+        if working is None:
+            return {'CANCELLED'}
+
+        props.status_message = "Submitting..."
+        props.error_message = ""
+
+        filepath = bpy.data.filepath
+        file_name = os.path.basename(filepath)
+
+        def work(task):
+            # An autosave that already started would otherwise move the
+            # work branch again after it is removed
+            _auto_push_queue.wait(_auto_push_key(working))
+            return client.submit_file(
+                working['repo_owner'],
+                working['repo_name'],
+                working['file_path'],
+                filepath,
+                message=f"Submit {file_name} from Blender"
+            )
+
+        def on_done(task):
+            if task.error:
+                _show_task_error(task, "Error submitting file")
+                return
+
+            success, error = task.result
+            if not success:
+                tasks.update_status(status_message="", error_message=error)
+                return
+
+            props = bpy.context.scene.github_classroom
+            for item in props.github_repos:
+                if (item.owner == working['repo_owner']
+                        and item.repo_name == working['repo_name']):
+                    item.submitted = True
+                    props.repos_revision += 1
+            tasks.update_status(status_message="Submitted successfully!")
+
+        tasks.start_task("Submit", work, on_done)
         return {'FINISHED'}
 
 
@@ -262,6 +768,22 @@ class GITHUB_OT_ToggleAutoPush(Operator):
         return {'FINISHED'}
 
 
+class GITHUB_OT_ToggleWorkBranch(Operator):
+    """Toggle autosaving to the work branch"""
+    bl_idname = "github_class.toggle_work_branch"
+    bl_label = "Toggle Autosave Branch"
+    bl_description = ("Toggle whether auto-push saves to your own autosave "
+                      "branch (handed in with Submit) instead of committing "
+                      "every save to the assignment")
+
+    def execute(self, context):
+        client = get_github_client()
+        client.set_autosave_to_branch(not client.autosave_to_branch)
+        state = "enabled" if client.autosave_to_branch else "disabled"
+        self.report({'INFO'}, f"Autosave branch {state}")
+        return {'FINISHED'}
+
+
 class GITHUB_OT_Disconnect(Operator):
     """Disconnect current file from GitHub"""
     bl_idname = "github_class.disconnect"
@@ -277,24 +799,89 @@ class GITHUB_OT_Disconnect(Operator):
         return {'FINISHED'}
 
 
-class GITHUB_OT_SelectRepo(bpy.types.Operator):
-    """Select a GitHub Classroom assignment repo"""
-    bl_idname = "github_class.select_repo"
-    bl_label = "Select Repo"
-
-    repo_index: bpy.props.IntProperty()
+class GITHUB_OT_CancelTask(Operator):
+    """Cancel the running GitHub operation"""
+    bl_idname = "github_class.cancel_task"
+    bl_label = "Cancel"
+    bl_description = "Stop the GitHub operation that is currently running"
 
     def execute(self, context):
-        props = context.scene.github_classroom
-        props.active_repo_index = self.repo_index
+        if tasks.get_active_task() is None:
+            return {'CANCELLED'}
+        tasks.cancel_all()
+        context.scene.github_classroom.status_message = "Cancelling..."
         return {'FINISHED'}
 
 
 # --- Save handler for auto-push ---
 
+def _auto_push_upload(job):
+    """Upload the latest saved bytes of a working file (worker thread)"""
+    client = get_github_client()
+    tasks.call_on_main_thread(
+        tasks.update_status, status_message="Auto-pushing to GitHub..."
+    )
+    # Interim saves go to the work branch, if enabled
+    if job['to_branch']:
+        upload = client.autosave_file
+    else:
+        upload = client.upload_file
+    return upload(
+        job['repo_owner'],
+        job['repo_name'],
+        job['file_path'],
+        job['filepath'],
+        message=f"Auto-save {os.path.basename(job['filepath'])} from Blender"
+    )
+
+
+def _auto_push_done(job, result):
+    """Show the outcome of an auto-push in the panel (main thread)"""
+    if isinstance(result, Exception):
+        success, error = False, str(result)
+    else:
+        success, error = result
+
+    if success and error == UP_TO_DATE_MESSAGE:
+        tasks.update_status(
+            status_message="Auto-push: already up to date", error_message=""
+        )
+    elif success and job['to_branch']:
+        tasks.update_status(
+            status_message="Autosaved to your work branch", error_message=""
+        )
+    elif success:
+        tasks.update_status(
+            status_message="Auto-pushed to GitHub", error_message=""
+        )
+    else:
+        tasks.update_status(
+            status_message="",
+            error_message=(
+                f"Auto-push failed: {error}. "
+                f"Try manual push or check your connection."
+            )
+        )
+
+
+def _auto_push_key(working):
+    """Get the auto-push queue key of a working file"""
+    return (working['repo_owner'], working['repo_name'],
+            working['file_path'])
+
+
+_auto_push_queue = tasks.CoalescingQueue(
+    "Auto-push", _auto_push_upload, _auto_push_done
+)
+
+
 @bpy.app.handlers.persistent
 def auto_push_on_save(dummy):
-    """Automatically push to GitHub after saving (if enabled)"""
+    """
+    Queue a push to GitHub after saving (if enabled).
+    The upload runs in the background; saves of the same working file
+    that arrive before it starts are merged into one push.
+    """
     client = get_github_client()
 
     if not client.is_authenticated() or not client.auto_push:
@@ -308,25 +895,14 @@ def auto_push_on_save(dummy):
     if not filepath:
         return
 
-    file_name = os.path.basename(filepath)
-    success, error = client.upload_file(
-        working['repo_owner'],
-        working['repo_name'],
-        working['file_path'],
-        filepath,
-        message=f"Auto-save {file_name} from Blender"
-    )
+    _auto_push_queue.submit(_auto_push_key(working), {
+        **working, 'filepath': filepath,
+        'to_branch': client.autosave_to_branch,
+    })
 
     # Update UI status if possible
     try:
         props = bpy.context.scene.github_classroom
-        if success:
-            props.status_message = "Auto-pushed to GitHub"
-            props.error_message = ""
-        else:
-            props.error_message = (
-                f"Auto-push failed: {error}. "
-                f"Try manual push or check your connection."
-            )
+        props.status_message = "Auto-push queued"
     except Exception:
         pass
@@ -23,8 +23,19 @@ class GitHubRepoItem(PropertyGroup):
     has_blend_file: BoolProperty(name="Has Blend File", default=False)
     blend_file_path: StringProperty(name="Blend File Path")
     blend_file_name: StringProperty(name="Blend File Name")
+    blend_file_sha: StringProperty(name="Blend File SHA")
+    blend_file_size: IntProperty(name="Blend File Size", default=0)
     updated_at: StringProperty(name="Last Updated")
     submitted: BoolProperty(name="Submitted", default=False)
+    student_login: StringProperty(
+        name="Student",
+        description="GitHub username of the student who accepted the "
+                    "assignment (Classroom API only)"
+    )
+    summary: StringProperty(
+        name="Summary",
+        description="Contents of the downloaded .blend file"
+    )
 
 
 class GitHubClassroomProperties(PropertyGroup):
@@ -72,6 +83,105 @@ class GitHubClassroomProperties(PropertyGroup):
     # Repository list
     github_repos: CollectionProperty(type=GitHubRepoItem)
     active_repo_index: IntProperty(name="Active Repo", default=-1)
+    repos_revision: IntProperty(
+        name="Repos Revision",
+        description="Increased whenever the repository list changes, so "
+                    "its filtered and sorted order is recomputed",
+        default=0
+    )
+
+    # Submission downloads (teachers)
+    assignment_name: StringProperty(
+        name="Assignment",
+        description="Assignment name: student repositories are named "
+                    "<assignment>-<student>, e.g. 'week3-render-alice'. "
+                    "When set, only this assignment's repositories are "
+                    "loaded. Leave empty to use every repository",
+        default=""
+    )
+
+    updated_within_days: IntProperty(
+        name="Updated Within (Days)",
+        description="Only load repositories updated in the last number of "
+                    "days (0 loads all)",
+        default=0,
+        min=0,
+        max=3650
+    )
+
+    submissions_dir: StringProperty(
+        name="Save To",
+        description="Folder for downloaded submissions; each assignment "
+                    "gets its own subfolder",
+        subtype='DIR_PATH',
+        default=""
+    )
+
+    max_concurrent_downloads: IntProperty(
+        name="Parallel Downloads",
+        description="Maximum number of files to download at the same time",
+        default=4,
+        min=1,
+        max=16
+    )
+
+    analysis_mode: EnumProperty(
+        name="Analysis",
+        description="How downloaded submissions are analyzed",
+        items=[
+            ('QUICK', "Quick",
+             "Read object, mesh and material counts from the files "
+             "without opening them (milliseconds per file)"),
+            ('FULL', "Full",
+             "Open every file in background Blender processes to also "
+             "report polygons, modifiers and render settings"),
+        ],
+        default='QUICK',
+    )
+
+    analysis_processes: IntProperty(
+        name="Blender Processes",
+        description="Background Blender processes for full analysis "
+                    "(0 uses one per CPU core)",
+        default=0,
+        min=0,
+        max=64
+    )
+
+    # Network settings
+    download_cache_mb: IntProperty(
+        name="Download Cache (MB)",
+        description="Disk space for keeping downloaded .blend files, so "
+                    "opening the same version again needs no download",
+        default=1024,
+        min=0,
+        max=65536
+    )
+
+    teacher_source: EnumProperty(
+        name="Load Using",
+        description="How student repositories are loaded for teachers",
+        items=[
+            ('REST', "REST",
+             "List repositories, then check each one for .blend files"),
+            ('GRAPHQL', "GraphQL Batch",
+             "Load 100 repositories and their root files per request "
+             "(only finds .blend files in the repository root)"),
+            ('CLASSROOM', "Classroom API",
+             "Load exactly the repositories of accepted assignments, with "
+             "student names and submission state (classroom admins only)"),
+        ],
+        default='REST',
+    )
+
+    max_concurrent_requests: IntProperty(
+        name="Parallel Requests",
+        description="Maximum number of GitHub requests to run at the same "
+                    "time when loading many repositories",
+        default=8,
+        min=1,
+        max=32
+    )
 
     # UI state
     show_repos: BoolProperty(
@@ -0,0 +1,264 @@
+"""
+Background tasks for the GitHub Classroom add-on
+Network calls run on worker threads so Blender's UI stays responsive.
+Progress and results are handed back to the main thread through
+bpy.app.timers, the only place where Blender data may be touched.
+"""
+
+import time
+import queue
+import threading
+import traceback
+import bpy
+from .github_client import OperationCancelled
+
+# Seconds between checks for messages from worker threads
+POLL_INTERVAL = 0.1
+
+# Calls waiting to run on the main thread
+_main_thread_calls = queue.Queue()
+
+# Tasks that have been started and not finished yet (main thread only)
+_active_tasks = []
+
+# Seconds to wait for more saves before an auto-push starts
+PUSH_COALESCE_DELAY = 2.0
+
+# Running job queues, stopped on unregister
+_job_queues = []
+
+
+class BackgroundTask:
+    """
+    A unit of work running on its own thread.
+    work(task) runs on the worker thread and must not touch Blender data;
+    on_done(task) runs on the main thread afterwards with task.result or
+    task.error set (neither is set when the task was cancelled).
+    """
+
+    def __init__(self, name, work, on_done=None):
+        self.name = name
+        self.result = None
+        self.error = None
+        self._work = work
+        self._on_done = on_done
+        self._cancel_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"github-classroom-{name}", daemon=True
+        )
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """Ask the task to stop at its next check"""
+        self._cancel_event.set()
+
+    def check_cancelled(self):
+        """Raise OperationCancelled if the task was cancelled.
+        Called from the worker thread between steps."""
+        if self._cancel_event.is_set():
+            raise OperationCancelled()
+
+    def report(self, message):
+        """Show a progress message in the panel (from the worker thread)"""
+        call_on_main_thread(update_status, status_message=message)
+
+    def _run(self):
+        try:
+            self.result = self._work(self)
+        except OperationCancelled:
+            pass
+        except Exception as e:
+            traceback.print_exc()
+            self.error = e
+        finally:
+            call_on_main_thread(self._finish)
+
+    def _finish(self):
+        if self in _active_tasks:
+            _active_tasks.remove(self)
+        if self.cancelled:
+            update_status(status_message=f"{self.name} cancelled")
+            return
+        if self._on_done is not None:
+            self._on_done(self)
+
+
+class CoalescingQueue:
+    """
+    Background queue that keeps only the newest job per key.
+    Jobs wait delay seconds before they run, so a burst of submissions
+    for the same key (e.g. rapid saves of one file) runs once, with the
+    latest job. run(job) is called on the worker thread and its return
+    value is passed to on_result(job, result) on the main thread.
+    """
+
+    def __init__(self, name, run, on_result, delay=PUSH_COALESCE_DELAY):
+        self.name = name
+        self._run_job = run
+        self._on_result = on_result
+        self.delay = delay
+        self._pending = {}
+        self._running = False
+        self._running_key = None
+        self._stopped = False
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, key, job):
+        """Queue job, replacing any job with the same key that has not
+        started yet (thread-safe)"""
+        with self._condition:
+            self._pending[key] = (time.monotonic(), job)
+            self._stopped = False
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._worker, name=f"github-classroom-{self.name}",
+                    daemon=True
+                )
+                self._thread.start()
+                if self not in _job_queues:
+                    _job_queues.append(self)
+            self._condition.notify()
+
+    def discard(self, key):
+        """Drop the job with key if it has not started yet
+        (thread-safe)"""
+        with self._condition:
+            self._pending.pop(key, None)
+            self._condition.notify_all()
+
+    def wait(self, key):
+        """Wait until no job with key is running (thread-safe; not to be
+        called on the main thread, which delivers the results)"""
+        with self._condition:
+            while self._running and self._running_key == key:
+                self._condition.wait()
+
+    def is_busy(self):
+        """Check whether jobs are waiting or running"""
+        with self._condition:
+            return self._running or bool(self._pending)
+
+    def stop(self):
+        """Drop waiting jobs and stop the worker after the current job"""
+        with self._condition:
+            self._pending.clear()
+            self._stopped = True
+            self._condition.notify()
+
+    def _next_job(self):
+        """Wait for the oldest job that has been quiet for delay seconds"""
+        with self._condition:
+            while True:
+                if self._stopped:
+                    return None
+                if not self._pending:
+                    self._condition.wait()
+                    continue
+                key, (queued_at, job) = min(
+                    self._pending.items(), key=lambda item: item[1][0]
+                )
+                remaining = queued_at + self.delay - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                del self._pending[key]
+                self._running = True
+                self._running_key = key
+                return job
+
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            try:
+                result = self._run_job(job)
+            except Exception as e:
+                traceback.print_exc()
+                result = e
+            finally:
+                with self._condition:
+                    self._running = False
+                    self._running_key = None
+                    self._condition.notify_all()
+            call_on_main_thread(self._on_result, job, result)
+
+
+def call_on_main_thread(func, *args, **kwargs):
+    """Queue a call to run on Blender's main thread (thread-safe)"""
+    _main_thread_calls.put((func, args, kwargs))
+
+
+def update_status(**values):
+    """Set properties of the scene's github_classroom settings and redraw
+    the sidebar. Must run on the main thread."""
+    try:
+        props = bpy.context.scene.github_classroom
+    except AttributeError:
+        return
+    for name, value in values.items():
+        setattr(props, name, value)
+    redraw_panels()
+
+
+def redraw_panels():
+    """Redraw all 3D Viewports so the sidebar shows new state"""
+    window_manager = bpy.context.window_manager
+    if window_manager is None:
+        return
+    for window in window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+def start_task(name, work, on_done=None):
+    """Start a background task (main thread only)"""
+    task = BackgroundTask(name, work, on_done)
+    _active_tasks.append(task)
+    task._thread.start()
+    redraw_panels()
+    return task
+
+
+def get_active_task():
+    """Get the oldest running task, or None"""
+    return _active_tasks[0] if _active_tasks else None
+
+
+def cancel_all():
+    """Ask all running tasks to stop"""
+    for task in _active_tasks:
+        task.cancel()
+
+
+def _poll():
+    """Timer callback: run queued main-thread calls"""
+    while True:
+        try:
+            func, args, kwargs = _main_thread_calls.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            func(*args, **kwargs)
+        except Exception:
+            traceback.print_exc()
+    return POLL_INTERVAL
+
+
+def register():
+    if not bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.register(_poll, persistent=True)
+
+
+def unregister():
+    cancel_all()
+    for job_queue in _job_queues:
+        job_queue.stop()
+    _job_queues.clear()
+    if bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.unregister(_poll)
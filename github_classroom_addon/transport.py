@@ -0,0 +1,334 @@
+"""
+Pooled HTTP transport for the GitHub Classroom add-on
+Keeps connections open between requests (HTTP keep-alive) so that bulk
+operations don't pay a new TCP+TLS handshake for every API call.
+Uses only Python standard library (no external dependencies required).
+"""
+
+import io
+import os
+import gzip
+import json
+import base64
+import ssl
+import threading
+import http.client
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Optional, List, Dict, Any, Tuple
+
+# Bytes written to the socket per send() call
+SEND_BLOCK_SIZE = 64 * 1024
+
+# Bytes of a file read per step when encoding a streaming body
+# (a multiple of 3 so chunks encode to base64 without padding)
+ENCODE_CHUNK_SIZE = 3 * 64 * 1024
+
+# Idle connections kept open per host
+DEFAULT_MAX_IDLE_PER_HOST = 16
+
+# Seconds to wait on a socket operation before giving up
+DEFAULT_TIMEOUT = 60
+
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# Errors that mean a kept-alive connection was closed by the server
+# while it sat idle in the pool
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+    ConnectionAbortedError,
+)
+
+
+class Base64JSONBody:
+    """
+    Streaming request body for a JSON object with one field holding a
+    file's contents base64-encoded, as used by the contents and blobs
+    APIs. The file is read and encoded chunk by chunk while the request
+    is sent, so memory use stays constant regardless of the file size.
+    len() gives the exact Content-Length.
+    """
+
+    def __init__(self, fields: Dict[str, Any], content_field: str, path: str):
+        # Base64 output never needs JSON escaping, so the body is
+        # '{<fields>, "<content_field>": "' + base64 + '"}'
+        head = json.dumps(fields)[:-1]
+        if fields:
+            head += ', '
+        self._prefix = f'{head}{json.dumps(content_field)}: "'.encode('utf-8')
+        self._suffix = b'"}'
+        self._path = path
+        file_size = os.path.getsize(path)
+        self._length = (len(self._prefix) + 4 * ((file_size + 2) // 3)
+                        + len(self._suffix))
+        self._file = None
+        self.seek(0)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Rewind to the start (the only supported position)"""
+        if offset != 0 or whence != 0:
+            raise io.UnsupportedOperation("can only rewind to the start")
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self._path, 'rb')
+        self._buffer = self._prefix
+        self._finished = False
+        return 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length
+        while len(self._buffer) < size and not self._finished:
+            chunk = self._file.read(ENCODE_CHUNK_SIZE)
+            if chunk:
+                self._buffer += base64.b64encode(chunk)
+            else:
+                self._buffer += self._suffix
+                self._finished = True
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class PooledResponse:
+    """
+    A streaming HTTP response. The connection goes back to the pool once
+    the body has been read to the end; otherwise it is closed.
+    """
+
+    def __init__(self, pool: 'ConnectionPool', key: Tuple[str, str, int],
+                 conn: http.client.HTTPConnection,
+                 response: http.client.HTTPResponse, url: str):
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._response = response
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        data = self._response.read(amt)
+        self._pool._count_received(len(data))
+        return data
+
+    def close(self):
+        """Release the connection"""
+        if self._conn is None:
+            return
+        if self._response.isclosed() and not self._response.will_close:
+            self._pool._checkin(self._key, self._conn)
+        else:
+            self._conn.close()
+        self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive connections, grouped by host"""
+
+    def __init__(self, max_idle_per_host: int = DEFAULT_MAX_IDLE_PER_HOST,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.max_idle_per_host = max_idle_per_host
+        self.timeout = timeout
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+
+        # Counters (see stats())
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.bytes_received = 0
+        self.bytes_saved = 0
+
+    # --- Connection management ---
+
+    def _new_connection(self, key: Tuple[str, str, int]) -> http.client.HTTPConnection:
+        """Open a new connection, going through a proxy if one is configured"""
+        scheme, host, port = key
+        proxy = urllib.request.getproxies().get(scheme)
+        if proxy and urllib.request.proxy_bypass(host):
+            proxy = None
+
+        if proxy:
+            parts = urllib.parse.urlsplit(proxy)
+            conn_host = parts.hostname
+            conn_port = parts.port
+        else:
+            conn_host, conn_port = host, port
+
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(
+                conn_host, conn_port, timeout=self.timeout,
+                context=self._ssl_context, blocksize=SEND_BLOCK_SIZE
+            )
+        else:
+            conn = http.client.HTTPConnection(
+                conn_host, conn_port, timeout=self.timeout,
+                blocksize=SEND_BLOCK_SIZE
+            )
+        if proxy:
+            conn.set_tunnel(host, port)
+
+        with self._lock:
+            self.connections_opened += 1
+        return conn
+
+    def _checkout(self, key: Tuple[str, str, int]) -> Tuple[http.client.HTTPConnection, bool]:
+        """Take an idle connection for key, or open a new one.
+        Returns: (connection, reused)"""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.connections_reused += 1
+                return idle.pop(), True
+        return self._new_connection(key), False
+
+    def _checkin(self, key: Tuple[str, str, int],
+                 conn: http.client.HTTPConnection):
+        """Return a connection to the pool"""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close_all(self):
+        """Close all idle connections"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _count_received(self, count: int):
+        with self._lock:
+            self.bytes_received += count
+
+    def stats(self) -> Dict[str, int]:
+        """Get connection and transfer counters"""
+        with self._lock:
+            return {
+                'connections_opened': self.connections_opened,
+                'connections_reused': self.connections_reused,
+                'bytes_received': self.bytes_received,
+                'bytes_saved': self.bytes_saved,
+            }
+
+    # --- Requests ---
+
+    @staticmethod
+    def _split_url(url: str) -> Tuple[Tuple[str, str, int], str]:
+        """Split url into a pool key and the request target"""
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == 'https' else 80)
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        return (scheme, parts.hostname, port), target
+
+    def _send(self, method: str, url: str, headers: Dict[str, str],
+              body: Any) -> PooledResponse:
+        """Send a single request (no redirects), retrying once if a
+        pooled connection turns out to have been closed by the server.
+        body may be bytes or a rewindable file-like object."""
+        key, target = self._split_url(url)
+        while True:
+            conn, reused = self._checkout(key)
+            if hasattr(body, 'seek'):
+                body.seek(0)
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                response = conn.getresponse()
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+            return PooledResponse(self, key, conn, response, url)
+
+    def open(self, method: str, url: str,
+             headers: Optional[Dict[str, str]] = None,
+             body: Any = None) -> PooledResponse:
+        """
+        Send a request and return the streaming response.
+        Redirects are followed; the Authorization header is only sent
+        to the original host. Raises urllib.error.HTTPError for 4xx/5xx
+        responses, like urllib.request.urlopen.
+        """
+        headers = dict(headers or {})
+        original_host = self._split_url(url)[0][1]
+
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._send(method, url, headers, body)
+            status = response.status
+            location = response.headers.get('Location')
+
+            if status in REDIRECT_CODES and location:
+                # Drain the body so the connection can be reused
+                response.read()
+                response.close()
+                url = urllib.parse.urljoin(url, location)
+                if status == 303 or (status in (301, 302) and method == 'POST'):
+                    method, body = 'GET', None
+                    for name in ('Content-Type', 'Content-Length',
+                                 'Content-Encoding'):
+                        headers.pop(name, None)
+                if self._split_url(url)[0][1] != original_host:
+                    headers.pop('Authorization', None)
+                continue
+
+            if status >= 400:
+                error_body = response.read()
+                response.close()
+                raise urllib.error.HTTPError(
+                    url, status, response.reason, response.headers,
+                    io.BytesIO(error_body)
+                )
+            return response
+
+        raise urllib.error.URLError(f"Too many redirects for {url}")
+
+    def request(self, method: str, url: str,
+                headers: Optional[Dict[str, str]] = None,
+                body: Any = None) -> Tuple[int, Any, bytes]:
+        """
+        Send a request and read the whole (gzip-decoded) response body.
+        Returns: (status, headers, body)
+        """
+        headers = dict(headers or {})
+        headers.setdefault('Accept-Encoding', 'gzip')
+
+        with self.open(method, url, headers, body) as response:
+            data = response.read()
+            status, response_headers = response.status, response.headers
+
+        if response_headers.get('Content-Encoding', '').lower() == 'gzip':
+            compressed_size = len(data)
+            data = gzip.decompress(data)
+            with self._lock:
+                self.bytes_saved += len(data) - compressed_size
+
+        return status, response_headers, data
@@ -3,8 +3,11 @@ UI panel classes for GitHub Classroom Blender add-on
 Simplified interface for students (non-programmers) and teachers
 """
 
+import time
+import fnmatch
 import bpy
-from bpy.types import Panel
+from bpy.types import Panel, UIList
+from . import tasks
 from .github_client import get_github_client
 
 MAX_LINE_LENGTH = 40
@@ -63,15 +66,30 @@ class GITHUB_PT_MainPanel(Panel):
             box.label(text="Classroom", icon='COMMUNITY')
             box.prop(props, "github_org", text="Organization")
             if props.role == 'TEACHER':
-                box.operator(
+                row = box.row(align=True)
+                row.operator(
                     "github_class.refresh_repos",
                     text="Load Student Repos", icon='FILE_REFRESH'
                 )
+                op = row.operator(
+                    "github_class.refresh_repos", text="", icon='RECOVER_LAST'
+                )
+                op.full_refresh = True
+                box.prop(props, "assignment_name")
+                box.prop(props, "updated_within_days")
+                box.prop(props, "teacher_source")
+                box.prop(props, "max_concurrent_requests")
+                draw_rate_limit(box, client)
             else:
-                box.operator(
+                row = box.row(align=True)
+                row.operator(
                     "github_class.refresh_repos",
                     text="Load My Assignments", icon='FILE_REFRESH'
                 )
+                op = row.operator(
+                    "github_class.refresh_repos", text="", icon='RECOVER_LAST'
+                )
+                op.full_refresh = True
 
         # Working file status (for students with auto-push)
         if props.role == 'STUDENT' and client.is_authenticated():
@@ -92,9 +110,22 @@ class GITHUB_PT_MainPanel(Panel):
                     "github_class.toggle_auto_push",
                     text="Auto-Push on Save", icon=icon
                 )
+                if client.auto_push:
+                    if client.autosave_to_branch:
+                        icon = 'CHECKBOX_HLT'
+                    else:
+                        icon = 'CHECKBOX_DEHLT'
+                    box.operator(
+                        "github_class.toggle_work_branch",
+                        text="Autosave to Work Branch", icon=icon
+                    )
 
-                # Manual push button
-                box.operator("github_class.push_file", icon='EXPORT')
+                # Manual push button (with the work branch, saves are
+                # handed in with Submit)
+                if client.autosave_to_branch:
+                    box.operator("github_class.submit_file", icon='EXPORT')
+                else:
+                    box.operator("github_class.push_file", icon='EXPORT')
 
                 # Disconnect
                 box.operator("github_class.disconnect", icon='X')
@@ -103,6 +134,8 @@ class GITHUB_PT_MainPanel(Panel):
         if props.status_message:
             box = layout.box()
             box.label(text=props.status_message, icon='INFO')
+            if tasks.get_active_task() is not None:
+                box.operator("github_class.cancel_task", icon='CANCEL')
 
         if props.error_message:
             box = layout.box()
@@ -110,6 +143,136 @@ class GITHUB_PT_MainPanel(Panel):
             wrap_text(props.error_message, box)
 
 
+def draw_rate_limit(layout, client):
+    """Show the remaining GitHub API budget, if known"""
+    budget = client.get_rate_limit()
+    if not budget:
+        return
+    reset_time = time.strftime('%H:%M', time.localtime(budget['reset']))
+    if budget['remaining'] < 100:
+        icon = 'ERROR'
+    else:
+        icon = 'SORTTIME'
+    layout.label(
+        text=f"API requests left: {budget['remaining']}/{budget['limit']} "
+             f"(resets {reset_time})",
+        icon=icon
+    )
+
+
+def format_size(num_bytes):
+    """Format a byte count for display"""
+    for unit in ("B", "KB", "MB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+
+# Filter flags and order of the repository list for the last
+# (repos_revision, filter, sort) combination; filter_items runs on every
+# redraw, but the result only changes with the list or the filter
+_repo_list_cache = {'key': None, 'flags': [], 'order': []}
+
+
+class GITHUB_UL_Repos(UIList):
+    """Repository list that only draws the visible rows"""
+    bl_idname = "GITHUB_UL_repos"
+
+    sort_by: bpy.props.EnumProperty(
+        name="Sort By",
+        description="Order of the repository list",
+        items=[
+            ('NAME', "Name", "Sort by repository name"),
+            ('UPDATED', "Updated", "Most recently updated first"),
+            ('SUBMITTED', "Submitted", "Submitted assignments first"),
+        ],
+        default='NAME',
+    )
+
+    def draw_item(self, context, layout, data, item, icon, active_data,
+                  active_propname, index):
+        row = layout.row(align=True)
+        row.label(
+            text=item.repo_name,
+            icon='FILE_BLEND' if item.has_blend_file else 'FILE_FOLDER'
+        )
+        if item.student_login:
+            row.label(text=f"@{item.student_login}")
+        # Summaries of downloaded submissions, to compare them at a glance
+        if item.summary:
+            row.label(text=item.summary)
+        if item.submitted:
+            row.label(text="", icon='CHECKMARK')
+
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_invert", text="", icon='ARROW_LEFTRIGHT')
+        row = layout.row(align=True)
+        row.prop(self, "sort_by", expand=True)
+        row.prop(self, "use_filter_sort_reverse", text="", icon='SORT_DESC')
+
+    def filter_items(self, context, data, propname):
+        """Filter by name or student and sort (inverting and reversing
+        are applied by Blender)"""
+        items = getattr(data, propname)
+        key = (data.repos_revision, len(items), self.filter_name,
+               self.sort_by)
+        if _repo_list_cache['key'] != key:
+            _repo_list_cache['flags'] = filter_repo_items(
+                items, self.filter_name, self.bitflag_filter_item
+            )
+            _repo_list_cache['order'] = sort_repo_items(items, self.sort_by)
+            _repo_list_cache['key'] = key
+        return _repo_list_cache['flags'], _repo_list_cache['order']
+
+
+def filter_repo_items(items, pattern, bitflag):
+    """
+    Match repository and student names against a filter pattern
+    (case-insensitive, with * and ? wildcards, like Blender's lists).
+    Returns: list of filter flags, bitflag for shown items
+    """
+    if not pattern:
+        return [bitflag] * len(items)
+    pattern = f"*{pattern.lower()}*"
+    return [
+        bitflag if (fnmatch.fnmatchcase(item.repo_name.lower(), pattern)
+                    or fnmatch.fnmatchcase(item.student_login.lower(),
+                                           pattern))
+        else 0
+        for item in items
+    ]
+
+
+def sort_repo_items(items, sort_by):
+    """
+    Sort repositories by 'NAME', 'UPDATED' (newest first) or
+    'SUBMITTED' (submitted first, then by name).
+    Returns: new position of each item, as UIList.filter_items expects
+    """
+    if sort_by == 'UPDATED':
+        def sort_key(index):
+            return items[index].updated_at
+        reverse = True
+    elif sort_by == 'SUBMITTED':
+        def sort_key(index):
+            return (not items[index].submitted,
+                    items[index].repo_name.lower())
+        reverse = False
+    else:
+        def sort_key(index):
+            return items[index].repo_name.lower()
+        reverse = False
+
+    order = sorted(range(len(items)), key=sort_key, reverse=reverse)
+    positions = [0] * len(items)
+    for position, index in enumerate(order):
+        positions[index] = position
+    return positions
+
+
 class GITHUB_PT_ReposPanel(Panel):
     """Assignment repositories panel"""
     bl_label = "Repositories"
@@ -139,68 +302,125 @@ class GITHUB_PT_ReposPanel(Panel):
             layout.label(
                 text=f"{count} student repos", icon='FILE_FOLDER'
             )
+            box = layout.box()
+            box.prop(props, "submissions_dir")
+            box.prop(props, "max_concurrent_downloads")
+            box.operator(
+                "github_class.download_all_submissions", icon='IMPORT'
+            )
+            row = box.row(align=True)
+            row.prop(props, "analysis_mode", expand=True)
+            if props.analysis_mode == 'FULL':
+                box.prop(props, "analysis_processes")
+            box.operator(
+                "github_class.analyze_submissions", icon='SPREADSHEET'
+            )
         else:
             layout.label(
                 text=f"{count} assignments", icon='FILE_FOLDER'
             )
 
-        for i, repo in enumerate(props.github_repos):
-            box = layout.box()
+        layout.template_list(
+            "GITHUB_UL_repos", "", props, "github_repos",
+            props, "active_repo_index", rows=8
+        )
+
+        if not 0 <= props.active_repo_index < count:
+            return
+        repo = props.github_repos[props.active_repo_index]
+
+        # Details of the selected repository
+        box = layout.box()
+        box.label(text=repo.repo_name, icon='FILE_FOLDER')
+        if repo.description:
+            box.label(text=repo.description, icon='TEXT')
+
+        if repo.student_login:
+            box.label(text=f"Student: @{repo.student_login}", icon='USER')
 
-            # Repo name as selection button
+        if repo.updated_at:
+            box.label(text=f"Updated: {repo.updated_at}", icon='TIME')
+
+        if repo.summary:
+            box.label(text=repo.summary, icon='SCENE_DATA')
+
+        # .blend file indicator
+        if repo.has_blend_file:
+            box.label(
+                text=f"File: {repo.blend_file_name}", icon='FILE_BLEND'
+            )
             row = box.row()
-            if i == props.active_repo_index:
-                icon = 'RADIOBUT_ON'
+            if props.role == 'TEACHER':
+                row.operator(
+                    "github_class.open_file",
+                    text="Open for Review", icon='FILEBROWSER'
+                )
             else:
-                icon = 'RADIOBUT_OFF'
-            op = row.operator(
-                "github_class.select_repo",
-                text=repo.repo_name, icon=icon, emboss=False
-            )
-            op.repo_index = i
+                row.operator(
+                    "github_class.open_file",
+                    text="Open Assignment", icon='FILEBROWSER'
+                )
+        else:
+            box.label(text="No .blend file found", icon='INFO')
 
-            # Show details if selected
-            if i == props.active_repo_index:
-                if repo.description:
-                    box.label(text=repo.description, icon='TEXT')
+        # Submission state and push button (students only)
+        if props.role == 'TEACHER':
+            if repo.submitted:
+                box.label(text="Submitted", icon='CHECKMARK')
+        else:
+            box.separator()
+            col = box.column()
+            client = get_github_client()
+            if client.autosave_to_branch:
+                push_operator = "github_class.submit_file"
+                push_text = "Submit"
+            else:
+                push_operator = "github_class.push_file"
+                push_text = "Save & Push"
+            if repo.submitted:
+                col.label(text="Submitted", icon='CHECKMARK')
+                col.operator(push_operator, text="Resubmit", icon='EXPORT')
+            else:
+                col.operator(push_operator, text=push_text, icon='EXPORT')
 
-                if repo.updated_at:
-                    box.label(
-                        text=f"Updated: {repo.updated_at}", icon='TIME'
-                    )
 
-                # .blend file indicator
-                if repo.has_blend_file:
-                    box.label(
-                        text=f"File: {repo.blend_file_name}",
-                        icon='FILE_BLEND'
-                    )
-                    row = box.row()
-                    if props.role == 'TEACHER':
-                        row.operator(
-                            "github_class.open_file",
-                            text="Open for Review", icon='FILEBROWSER'
-                        )
-                    else:
-                        row.operator(
-                            "github_class.open_file",
-                            text="Open Assignment", icon='FILEBROWSER'
-                        )
-                else:
-                    box.label(text="No .blend file found", icon='INFO')
-
-                # Push button (students only)
-                if props.role == 'STUDENT':
-                    box.separator()
-                    col = box.column()
-                    if repo.submitted:
-                        col.label(text="Submitted", icon='CHECKMARK')
-                        col.operator(
-                            "github_class.push_file",
-                            text="Resubmit", icon='EXPORT'
-                        )
-                    else:
-                        col.operator(
-                            "github_class.push_file",
-                            text="Save & Push", icon='EXPORT'
-                        )
+class GITHUB_PT_NetworkPanel(Panel):
+    """Connection statistics panel"""
+    bl_label = "Network"
+    bl_idname = "GITHUB_PT_network_panel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Classroom'
+    bl_parent_id = "GITHUB_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return get_github_client().is_authenticated()
+
+    def draw(self, context):
+        layout = self.layout
+        client = get_github_client()
+        stats = client.transport.stats()
+
+        col = layout.column(align=True)
+        col.label(
+            text=f"Connections opened: {stats['connections_opened']}",
+            icon='LINKED'
+        )
+        col.label(text=f"Connections reused: {stats['connections_reused']}")
+        col.label(text=f"Downloaded: {format_size(stats['bytes_received'])}")
+        col.label(
+            text=f"Saved by compression: {format_size(stats['bytes_saved'])}"
+        )
+        col.label(
+            text=f"Answered from cache: {client.response_cache.hits}",
+            icon='FILE_CACHE'
+        )
+        draw_rate_limit(layout, client)
+
+        props = context.scene.github_classroom
+        col = layout.column(align=True)
+        cache_size = format_size(client.blob_cache.total_bytes)
+        col.label(text=f"Download cache: {cache_size}", icon='FILE_BLEND')
+        col.prop(props, "download_cache_mb")